@@ -18,14 +18,17 @@ Long description of module's purpose
     'version': '0.1',
 
     # any module necessary for this one to work correctly
-    'depends': ['base', 'hr', 'web', 'mail'],
+    'depends': ['base', 'hr', 'hr_contract', 'hr_skills', 'web', 'mail'],
 
     # always loaded
     'data': [
         'security/ir.model.access.csv',
+        'security/hr_onboarding_report_security.xml',
         'views/hr_employee_views.xml',
         'views/res_config_settings.xml',
+        'views/employee_id_migration_views.xml',
         'views/hr_onboarding_report_views.xml',
+        'views/hr_onboarding_report_job_views.xml',
         'views/hr_onboarding_report_menu.xml',
         'views/custom_tabs_and_fields.xml',
         'views/cron_jobs.xml',
@@ -36,7 +39,6 @@ Long description of module's purpose
             'custom_hr_module/static/src/js/hr_onboarding_report.js',
             'custom_hr_module/static/src/css/hr_onboarding_report.css',
             'custom_hr_module/static/src/xml/hr_onboarding_report.xml',
-            'https://cdn.jsdelivr.net/npm/chart.js',
         ],
     },
     'installable': True,
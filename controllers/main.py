@@ -0,0 +1,82 @@
+import csv
+import io
+import tempfile
+
+import xlsxwriter
+
+from odoo import api, http
+from odoo.http import content_disposition, request
+from odoo.modules.registry import Registry
+
+REPORT_COLUMNS = [
+    ('employee_name', 'Employee Name'),
+    ('department', 'Department'),
+    ('job_title', 'Job Title'),
+    ('start_date', 'Start Date'),
+    ('end_date', 'End Date'),
+]
+
+
+class HROnboardingReportController(http.Controller):
+
+    @http.route('/custom_hr_module/onboarding_report/export/<string:file_format>', type='http', auth='user')
+    def export_onboarding_report(self, file_format, date_from, date_to, department_ids='', **kwargs):
+        """Stream the employee table of the onboarding report as CSV or XLSX."""
+        if file_format not in ('csv', 'xlsx'):
+            raise request.not_found()
+        request.env['hr.onboarding.report'].check_access('read')
+
+        department_ids = [int(department_id) for department_id in department_ids.split(',') if department_id]
+        rows = self._iter_report_rows(
+            request.env.cr.dbname, request.env.uid, dict(request.env.context),
+            date_from, date_to, department_ids or None,
+        )
+        if file_format == 'csv':
+            content_type = 'text/csv; charset=utf-8'
+            stream = self._stream_csv(rows)
+        else:
+            content_type = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+            stream = self._stream_xlsx(rows)
+
+        filename = f'onboarding_report_{date_from}_{date_to}.{file_format}'
+        return request.make_response(stream, headers=[
+            ('Content-Type', content_type),
+            ('Content-Disposition', content_disposition(filename)),
+        ])
+
+    def _iter_report_rows(self, dbname, uid, context, date_from, date_to, department_ids):
+        # The response body is consumed after the request cursor is closed: use our own
+        with Registry(dbname).cursor() as cr:
+            env = api.Environment(cr, uid, context)
+            yield from env['hr.onboarding.report']._iter_employee_rows(date_from, date_to, department_ids)
+
+    def _stream_csv(self, rows, flush_every=500):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([label for _key, label in REPORT_COLUMNS])
+        for index, row in enumerate(rows, 1):
+            writer.writerow([row[key] for key, _label in REPORT_COLUMNS])
+            if index % flush_every == 0:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue().encode()
+
+    def _stream_xlsx(self, rows, chunk_size=64 * 1024):
+        # XLSX is a zip archive and can only be sent once complete; constant_memory
+        # mode flushes each row to disk so memory stays flat while it is written.
+        with tempfile.TemporaryFile() as output:
+            workbook = xlsxwriter.Workbook(output, {'constant_memory': True})
+            worksheet = workbook.add_worksheet('Onboarding Report')
+            header_format = workbook.add_format({'bold': True})
+            for col, (_key, label) in enumerate(REPORT_COLUMNS):
+                worksheet.write(0, col, label, header_format)
+                worksheet.set_column(col, col, 25)
+            for row_index, row in enumerate(rows, 1):
+                for col, (key, _label) in enumerate(REPORT_COLUMNS):
+                    worksheet.write_string(row_index, col, row[key] or '')
+            workbook.close()
+
+            output.seek(0)
+            while chunk := output.read(chunk_size):
+                yield chunk
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 
 from . import inherit
+from . import employee_id_migration
 from . import res_config_settings
 from . import hr_onboarding_report
+from . import hr_onboarding_fact
+from . import hr_onboarding_report_job
 from . import custom_tabs_and_fields
 from . import notification_certificate
\ No newline at end of file
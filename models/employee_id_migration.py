@@ -0,0 +1,142 @@
+import logging
+import time
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+
+class HrEmployeeIdMigration(models.Model):
+    """Background rewrite of the stored Employee IDs after the ID format changed.
+
+    Employees are walked in id order, ``chunk_size`` at a time, committing after each
+    chunk so that the job can resume from ``last_employee_id`` if it is interrupted.
+    Every changed ID is recorded in ``hr.employee.id.mapping``.
+    """
+    _name = 'hr.employee.id.migration'
+    _description = 'Employee ID Format Migration'
+    _order = 'id desc'
+
+    name = fields.Char('Name', required=True, readonly=True)
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('cancelled', 'Cancelled'),
+    ], string='Status', default='pending', required=True, readonly=True)
+    chunk_size = fields.Integer('Chunk Size', default=1000, required=True)
+    last_employee_id = fields.Integer('Last Processed Employee', default=0, readonly=True,
+                                      help='Resume cursor: employees up to this database ID are migrated')
+    total_count = fields.Integer('Employees', readonly=True)
+    processed_count = fields.Integer('Processed', default=0, readonly=True)
+    changed_count = fields.Integer('Changed IDs', default=0, readonly=True)
+    progress = fields.Float('Progress', compute='_compute_progress')
+    date_done = fields.Datetime('Finished On', readonly=True)
+    mapping_ids = fields.One2many('hr.employee.id.mapping', 'migration_id', string='ID Changes', readonly=True)
+
+    @api.depends('processed_count', 'total_count', 'state')
+    def _compute_progress(self):
+        for migration in self:
+            if migration.state == 'done' or not migration.total_count:
+                migration.progress = 100.0 if migration.state == 'done' else 0.0
+            else:
+                migration.progress = min(100.0, 100.0 * migration.processed_count / migration.total_count)
+
+    @api.model
+    def _schedule(self):
+        """Queue a migration for the current ID format; it supersedes unfinished ones."""
+        self.search([('state', 'in', ('pending', 'running'))]).write({'state': 'cancelled'})
+        chunk_size = int(self.env['ir.config_parameter'].sudo().get_param(
+            'employee_id_format.migration_chunk_size', 1000
+        ))
+        self.env.cr.execute("SELECT COUNT(*) FROM hr_employee")
+        total_count = self.env.cr.fetchone()[0]
+        migration = self.create({
+            'name': fields.Datetime.to_string(fields.Datetime.now()),
+            'chunk_size': max(chunk_size, 1),
+            'total_count': total_count,
+        })
+        self.env.ref('custom_hr_module.cron_employee_id_migration')._trigger()
+        return migration
+
+    @api.model
+    def _cron_process_migrations(self, time_limit=240):
+        """Process queued migrations chunk by chunk, re-triggering itself when out of time."""
+        deadline = time.monotonic() + time_limit
+        for migration in self.search([('state', 'in', ('pending', 'running'))], order='id'):
+            if not migration._process(deadline):
+                self.env.ref('custom_hr_module.cron_employee_id_migration')._trigger()
+                return False
+        return True
+
+    def _process(self, deadline):
+        """Migrate chunks until done or past ``deadline``; return whether the migration finished.
+
+        A migration cancelled meanwhile (superseded by a newer format) stops after the
+        current chunk and counts as finished.
+        """
+        self.ensure_one()
+        Employee = self.env['hr.employee']
+        self.state = 'running'
+        self.env.cr.commit()
+        while time.monotonic() < deadline:
+            self.env.cr.execute("""
+                SELECT id FROM hr_employee WHERE id > %s ORDER BY id OFFSET %s LIMIT 1
+            """, (self.last_employee_id, self.chunk_size - 1))
+            row = self.env.cr.fetchone()
+            upto_id = row[0] if row else None
+
+            changes = Employee._recompute_employee_id_codes(self.last_employee_id, upto_id)
+            self.env['hr.employee.id.mapping'].create([{
+                'migration_id': self.id,
+                'employee_id': employee_id,
+                'old_code': old_code,
+                'new_code': new_code,
+            } for employee_id, old_code, new_code in changes])
+
+            if upto_id is None:
+                self.write({
+                    'state': 'done',
+                    'processed_count': self.total_count,
+                    'changed_count': self.changed_count + len(changes),
+                    'date_done': fields.Datetime.now(),
+                })
+                self.env.cr.commit()
+                _logger.info("Employee ID migration %s done, %s IDs changed", self.name, self.changed_count)
+                return True
+
+            self.write({
+                'last_employee_id': upto_id,
+                'processed_count': self.processed_count + self.chunk_size,
+                'changed_count': self.changed_count + len(changes),
+            })
+            self.env.cr.commit()
+
+            # Settings may have cancelled this migration while the chunk was processed
+            self.invalidate_recordset(['state'])
+            if self.state != 'running':
+                _logger.info("Employee ID migration %s stopped: %s", self.name, self.state)
+                return True
+        return False
+
+
+class HrEmployeeIdMapping(models.Model):
+    _name = 'hr.employee.id.mapping'
+    _description = 'Employee ID Change'
+    _order = 'id'
+
+    migration_id = fields.Many2one('hr.employee.id.migration', string='Migration', required=True,
+                                   ondelete='cascade', index=True)
+    employee_id = fields.Many2one('hr.employee', string='Employee', required=True, ondelete='cascade')
+    old_code = fields.Char('Old Employee ID')
+    new_code = fields.Char('New Employee ID')
+
+    @api.model
+    def get_changes(self, after_id=0, limit=1000):
+        """Return the ID changes recorded after mapping ``after_id``, for incremental sync.
+
+        Integrations store the last returned ``id`` and pass it back on their next call.
+        """
+        return self.search_read(
+            [('id', '>', after_id)], ['employee_id', 'old_code', 'new_code'], limit=limit, order='id'
+        )
@@ -0,0 +1,227 @@
+import logging
+from collections import Counter
+
+from odoo import api, fields, models
+from odoo.tools import SQL
+
+_logger = logging.getLogger(__name__)
+
+
+class HROnboardingFact(models.Model):
+    """Daily onboarding/offboarding counts per department and company.
+
+    Rows are kept up to date incrementally by the ``hr.employee`` and ``hr.contract``
+    hooks below, using the same hire/departure rules as the onboarding report.
+    Events are attributed to the employee's current department, like the report does.
+    ``_rebuild`` recomputes the whole table from the employees (backfill); it also
+    runs weekly (``cron_onboarding_fact_rebuild``) to reconcile the drift left by
+    changes that bypass the hooks, such as raw SQL updates.
+    """
+    _name = 'hr.onboarding.fact'
+    _description = 'HR Onboarding/Offboarding Fact'
+    _order = 'date desc'
+    _log_access = False
+
+    date = fields.Date('Date', required=True, readonly=True)
+    department_id = fields.Many2one('hr.department', string='Department', readonly=True, ondelete='cascade')
+    company_id = fields.Many2one('res.company', string='Company', required=True, readonly=True, ondelete='cascade')
+    event_type = fields.Selection([
+        ('onboarding', 'Onboarding'),
+        ('offboarding', 'Offboarding'),
+    ], string='Event', required=True, readonly=True)
+    count = fields.Integer('Count', readonly=True)
+
+    def init(self):
+        self.env.cr.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS hr_onboarding_fact_key_uniq
+                ON hr_onboarding_fact (date, event_type, company_id, COALESCE(department_id, 0))
+        """)
+        self.env.cr.execute("SELECT 1 FROM hr_onboarding_fact LIMIT 1")
+        if not self.env.cr.rowcount:
+            self._rebuild()
+
+    @api.model
+    def _get_employee_events(self, employees):
+        """Return the fact contributions of ``employees`` as a Counter of fact keys."""
+        events = Counter()
+        if not employees:
+            return events
+        Employee = self.env['hr.employee']
+        Employee.flush_model(['department_id', 'company_id'])
+        self.env.cr.execute(SQL("""
+            SELECT e.create_date::date, d.departure_date, e.department_id, e.company_id
+              FROM hr_employee e
+              JOIN (%s) d ON d.employee_id = e.id
+        """, Employee._get_departure_date_sql(SQL("%s", tuple(employees.ids)))))
+        for hire_date, departure_date, department_id, company_id in self.env.cr.fetchall():
+            events[hire_date, department_id, company_id, 'onboarding'] += 1
+            if departure_date:
+                events[departure_date, department_id, company_id, 'offboarding'] += 1
+        return events
+
+    @api.model
+    def _update_employee_events(self, employees, previous_events):
+        """Apply the difference between the current and ``previous_events`` of ``employees``."""
+        events = self._get_employee_events(employees.exists())
+        events.subtract(previous_events)
+        self._add_events(events)
+
+    @api.model
+    def _add_events(self, events):
+        rows = [key + (count,) for key, count in events.items() if count]
+        if not rows:
+            return
+        dates, department_ids, company_ids, event_types, counts = zip(*rows)
+        self.env.cr.execute("""
+            INSERT INTO hr_onboarding_fact (date, department_id, company_id, event_type, count)
+            SELECT date, department_id, company_id, event_type, GREATEST(count, 0)
+              FROM unnest(%s::date[], %s::integer[], %s::integer[], %s::varchar[], %s::integer[])
+                   AS event (date, department_id, company_id, event_type, count)
+                ON CONFLICT (date, event_type, company_id, COALESCE(department_id, 0))
+                -- Counts never go negative, even when facts drifted until the next rebuild
+                DO UPDATE SET count = GREATEST(hr_onboarding_fact.count + EXCLUDED.count, 0)
+            RETURNING id, count
+        """, (list(dates), list(department_ids), list(company_ids), list(event_types), list(counts)))
+        empty_ids = tuple(fact_id for fact_id, count in self.env.cr.fetchall() if not count)
+        if empty_ids:
+            self.env.cr.execute("DELETE FROM hr_onboarding_fact WHERE id IN %s", (empty_ids,))
+        self.invalidate_model()
+        self.env['hr.onboarding.report']._invalidate_report_cache(list(department_ids))
+
+    @api.model
+    def _rebuild(self):
+        """Recompute all facts from the employees in a single statement."""
+        Employee = self.env['hr.employee']
+        Employee.flush_model(['department_id', 'company_id'])
+        self.env.cr.execute("DELETE FROM hr_onboarding_fact")
+        self.env.cr.execute(SQL("""
+            WITH employee AS (
+                SELECT e.create_date::date AS hire_date, d.departure_date, e.department_id, e.company_id
+                  FROM hr_employee e
+                  JOIN (%s) d ON d.employee_id = e.id
+            )
+            INSERT INTO hr_onboarding_fact (date, department_id, company_id, event_type, count)
+            SELECT date, department_id, company_id, event_type, COUNT(*)
+              FROM (
+                    SELECT hire_date AS date, department_id, company_id, 'onboarding' AS event_type
+                      FROM employee
+                     UNION ALL
+                    SELECT departure_date, department_id, company_id, 'offboarding'
+                      FROM employee
+                     WHERE departure_date IS NOT NULL
+                   ) event
+             GROUP BY date, department_id, company_id, event_type
+        """, Employee._get_departure_date_sql(SQL("(SELECT id FROM hr_employee)"))))
+        _logger.info("Rebuilt onboarding facts: %s rows", self.env.cr.rowcount)
+        self.invalidate_model()
+        self.env['hr.onboarding.report']._invalidate_report_cache()
+        return True
+
+    @api.model
+    def action_rebuild(self):
+        self._rebuild()
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'type': 'success',
+                'message': 'Onboarding/offboarding facts have been rebuilt.',
+            },
+        }
+
+
+class HrEmployee(models.Model):
+    _inherit = 'hr.employee'
+
+    # Fields whose change can move an employee's onboarding/offboarding facts
+    _ONBOARDING_FACT_FIELDS = {'department_id', 'company_id', 'active', 'departure_date'}
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        employees = super().create(vals_list)
+        Fact = self.env['hr.onboarding.fact']
+        Fact._add_events(Fact._get_employee_events(employees))
+        return employees
+
+    def write(self, vals):
+        # Archived employees may fall back to write_date as departure date
+        if not (self._ONBOARDING_FACT_FIELDS & set(vals) or not all(self.mapped('active'))):
+            return super().write(vals)
+        Fact = self.env['hr.onboarding.fact']
+        previous_events = Fact._get_employee_events(self)
+        res = super().write(vals)
+        self._invalidate_departure_dates()
+        Fact._update_employee_events(self, previous_events)
+        return res
+
+    def unlink(self):
+        Fact = self.env['hr.onboarding.fact']
+        previous_events = Fact._get_employee_events(self)
+        res = super().unlink()
+        self._invalidate_departure_dates()
+        Fact._update_employee_events(self, previous_events)
+        return res
+
+
+class HrContract(models.Model):
+    _inherit = 'hr.contract'
+
+    def _get_onboarding_fact_employees(self, vals=None):
+        """Employees whose departure date comes from their contracts."""
+        employees = self.employee_id
+        if vals and vals.get('employee_id'):
+            employees |= self.env['hr.employee'].browse(vals['employee_id'])
+        return employees.sudo().filtered(lambda employee: not employee.active and not employee.departure_date)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        employees = self.env['hr.employee'].browse(
+            {vals['employee_id'] for vals in vals_list if vals.get('employee_id')}
+        ).sudo().filtered(lambda employee: not employee.active and not employee.departure_date)
+        Fact = self.env['hr.onboarding.fact']
+        previous_events = Fact._get_employee_events(employees)
+        contracts = super().create(vals_list)
+        self.env['hr.employee']._invalidate_departure_dates()
+        Fact._update_employee_events(employees, previous_events)
+        return contracts
+
+    def write(self, vals):
+        if not {'employee_id', 'date_end', 'active'} & set(vals):
+            return super().write(vals)
+        employees = self._get_onboarding_fact_employees(vals)
+        Fact = self.env['hr.onboarding.fact']
+        previous_events = Fact._get_employee_events(employees)
+        res = super().write(vals)
+        self.env['hr.employee']._invalidate_departure_dates()
+        Fact._update_employee_events(employees, previous_events)
+        return res
+
+    def unlink(self):
+        employees = self._get_onboarding_fact_employees()
+        Fact = self.env['hr.onboarding.fact']
+        previous_events = Fact._get_employee_events(employees)
+        res = super().unlink()
+        self.env['hr.employee']._invalidate_departure_dates()
+        Fact._update_employee_events(employees, previous_events)
+        return res
+
+
+class HrDepartment(models.Model):
+    _inherit = 'hr.department'
+
+    def unlink(self):
+        # Employees of deleted departments end up without department: move their facts along
+        if not self.ids:
+            return super().unlink()
+        self.env.cr.execute("""
+            INSERT INTO hr_onboarding_fact (date, department_id, company_id, event_type, count)
+            SELECT date, NULL, company_id, event_type, SUM(count)
+              FROM hr_onboarding_fact
+             WHERE department_id IN %s
+             GROUP BY date, company_id, event_type
+                ON CONFLICT (date, event_type, company_id, COALESCE(department_id, 0))
+                DO UPDATE SET count = hr_onboarding_fact.count + EXCLUDED.count
+        """, (tuple(self.ids),))
+        self.env['hr.onboarding.fact'].invalidate_model()
+        self.env['hr.onboarding.report']._invalidate_report_cache()
+        return super().unlink()
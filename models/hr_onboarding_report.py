@@ -1,6 +1,121 @@
 from odoo import models, fields, api
-from datetime import datetime, date
+from odoo.tools import SQL, split_every
+from odoo.tools.sql import create_index
+from collections import OrderedDict
+from datetime import datetime, date, timedelta
+from dateutil.relativedelta import relativedelta
+from functools import partial
 import json
+import threading
+import time
+
+
+class OnboardingReportCache:
+    """Bounded LRU cache of onboarding report results for one database.
+
+    Keys include the ``hr.onboarding.report.generation`` counters of the departments
+    they cover, so entries of changed departments are never hit again, in any worker;
+    they age out of the LRU (or after ``ttl``) instead of being evicted explicitly.
+    """
+
+    def __init__(self, max_size=128, ttl=3600):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and time.monotonic() - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+            }
+
+
+# generate_series steps of the trend intervals: PostgreSQL has no '1 quarter' interval
+TREND_INTERVAL_STEPS = {
+    'week': '1 week',
+    'month': '1 month',
+    'quarter': '3 months',
+}
+
+# Pseudo departments of the report generation counters
+NO_DEPARTMENT = 0
+ALL_DEPARTMENTS = -1
+
+_report_caches = {}
+_report_caches_lock = threading.Lock()
+
+
+class HROnboardingReportGeneration(models.Model):
+    """Change counters of the data behind the onboarding report, per department.
+
+    Bumped in the transaction that changes employees, contracts or departments and
+    part of the report cache keys, so that no worker serves a report computed before
+    a committed change. ``department_id`` is 0 for employees without department and
+    -1 for changes affecting every report (department names and hierarchy, rebuilds).
+    """
+    _name = 'hr.onboarding.report.generation'
+    _description = 'HR Onboarding/Offboarding Report Generation'
+    _log_access = False
+
+    department_id = fields.Integer('Department', required=True, readonly=True)
+    generation = fields.Integer('Generation', required=True, default=0, readonly=True)
+
+    _sql_constraints = [
+        ('department_uniq', 'UNIQUE(department_id)', 'One generation counter per department.'),
+    ]
+
+    @api.model
+    def _bump(self, department_ids):
+        if not department_ids:
+            return
+        # Sorted, so that concurrent transactions lock the counters in the same order
+        self.env.cr.execute("""
+            INSERT INTO hr_onboarding_report_generation (department_id, generation)
+            SELECT unnest(%s::integer[]), 1
+                ON CONFLICT (department_id)
+                DO UPDATE SET generation = hr_onboarding_report_generation.generation + 1
+        """, (sorted(set(department_ids)),))
+
+    @api.model
+    def _get_generation(self, department_ids=None):
+        """Sum of the counters of ``department_ids`` (all departments if None); it grows on every bump."""
+        if department_ids:
+            self.env.cr.execute("""
+                SELECT COALESCE(SUM(generation), 0) FROM hr_onboarding_report_generation
+                 WHERE department_id = ANY(%s)
+            """, (list(department_ids) + [ALL_DEPARTMENTS],))
+        else:
+            self.env.cr.execute("SELECT COALESCE(SUM(generation), 0) FROM hr_onboarding_report_generation")
+        return self.env.cr.fetchone()[0]
 
 
 class HROnboardingReport(models.TransientModel):
@@ -22,73 +137,595 @@ class HROnboardingReport(models.TransientModel):
         string='Departments',
         help='Leave empty to include all departments'
     )
+    report_mode = fields.Selection([
+        ('summary', 'Summary'),
+        ('trend', 'Trend'),
+    ], string='Mode', required=True, default='summary',
+        help='Trend adds hires and departures per period and department')
+    trend_interval = fields.Selection([
+        ('week', 'Weekly'),
+        ('month', 'Monthly'),
+        ('quarter', 'Quarterly'),
+    ], string='Trend Interval', required=True, default='month')
+    compare_with = fields.Selection([
+        ('none', 'No Comparison'),
+        ('previous_period', 'Previous Period'),
+        ('previous_year', 'Same Period Last Year'),
+    ], string='Compare With', required=True, default='none')
 
     @api.model
-    def get_report_data(self, date_from, date_to, department_ids=None):
-        domain = []
+    def _get_report_cache(self):
+        dbname = self.env.cr.dbname
+        with _report_caches_lock:
+            if dbname not in _report_caches:
+                max_size = int(self.env['ir.config_parameter'].sudo().get_param(
+                    'hr_onboarding_report.cache_size', 128
+                ))
+                _report_caches[dbname] = OnboardingReportCache(max_size=max_size)
+            return _report_caches[dbname]
+
+    @api.model
+    def _invalidate_report_cache(self, department_ids=None):
+        """Invalidate the cached reports covering ``department_ids`` (all reports if None).
+
+        ``False`` stands for employees without department. The generation counters are
+        bumped in the current transaction: other workers see it once it is committed.
+        """
+        if department_ids is None:
+            department_ids = [ALL_DEPARTMENTS]
+        self.env['hr.onboarding.report.generation']._bump(
+            [department_id or NO_DEPARTMENT for department_id in department_ids]
+        )
+
+    @api.model
+    def _get_cached_report(self, kind, date_from, date_to, department_ids, compute):
+        """Return ``compute()``, cached per period, departments, companies and user groups.
+
+        The key includes the generation of the departments, read in the same snapshot
+        as the data ``compute()`` reads.
+        """
+        department_ids = tuple(sorted(set(department_ids))) if department_ids else None
+        key = (
+            kind, date_from, date_to, department_ids,
+            tuple(sorted(self.env.companies.ids)),
+            tuple(sorted(self.env.user.groups_id.ids)),
+            self.env['hr.onboarding.report.generation']._get_generation(department_ids),
+        )
+        cache = self._get_report_cache()
+        result = cache.get(key)
+        if result is None:
+            result = compute()
+            cache.set(key, result)
+        return result
+
+    @api.model
+    def get_report_cache_stats(self):
+        """Hit/miss counters of this worker's report cache, to size ``hr_onboarding_report.cache_size``."""
+        return self._get_report_cache().stats()
+
+    @api.model
+    def _get_employee_dates_sql(self, department_ids=None, employee_ids=None, hired_between=None):
+        """SQL query returning the hire and departure date of every employee in scope.
 
+        Archived employees are included; the employee record rules of the current
+        user apply. See ``hr.employee._get_departure_date_sql`` for departure dates.
+        ``hired_between`` optionally restricts the employees to the ones hired between
+        two dates (inclusive).
+        """
+        domain = [('department_id', 'in', department_ids)] if department_ids else []
+        if employee_ids is not None:
+            domain.append(('id', 'in', employee_ids))
+        if hired_between:
+            # On the raw column, so that the (department_id, create_date) index applies
+            hired_from, hired_to = hired_between
+            domain += [
+                ('create_date', '>=', fields.Datetime.to_datetime(hired_from)),
+                ('create_date', '<', fields.Datetime.to_datetime(hired_to + timedelta(days=1))),
+            ]
+        Employee = self.env['hr.employee'].with_context(active_test=False)
+        Employee.flush_model(['name', 'department_id', 'job_title', 'job_id'])
+        employee_ids = Employee._search(domain).subselect()
+        return SQL("""
+            SELECT e.id, e.name, e.department_id, e.job_title, e.job_id,
+                   e.create_date::date AS hire_date,
+                   d.departure_date
+              FROM hr_employee e
+              JOIN (%s) d ON d.employee_id = e.id
+        """, Employee._get_departure_date_sql(employee_ids))
+
+    @api.model
+    def _get_department_names(self, department_ids):
+        departments = self.env['hr.department'].with_context(active_test=False).browse(
+            [department_id for department_id in department_ids if department_id]
+        )
+        names = {department.id: department.name for department in departments}
+        names[None] = 'No Department'
+        return names
+
+    @api.model
+    def _get_fact_domain_sql(self, department_ids=None):
+        """SQL condition restricting ``hr_onboarding_fact`` to the allowed companies and departments."""
+        condition = SQL("company_id IN %s", tuple(self.env.companies.ids))
         if department_ids:
-            domain.append(('department_id', 'in', department_ids))
-        employees = self.env['hr.employee'].with_context(active_test=False).search(domain)
+            condition = SQL("%s AND department_id IN %s", condition, tuple(department_ids))
+        return condition
 
-        report_data = []
-        onboarding_stats = {}
-        offboarding_stats = {}
+    @api.model
+    def _get_department_counts(self, date_from, date_to, department_ids=None):
+        """Return ``[(department_id, onboarding count, offboarding count)]`` from the fact table."""
+        self.env['hr.onboarding.fact'].flush_model()
+        self.env.cr.execute(SQL("""
+            SELECT department_id,
+                   COALESCE(SUM(count) FILTER (WHERE event_type = 'onboarding'), 0),
+                   COALESCE(SUM(count) FILTER (WHERE event_type = 'offboarding'), 0)
+              FROM hr_onboarding_fact
+             WHERE date BETWEEN %s AND %s AND %s
+             GROUP BY department_id
+        """, date_from, date_to, self._get_fact_domain_sql(department_ids)))
+        return self.env.cr.fetchall()
 
-        for employee in employees:
-            if employee.create_date and employee.create_date.date():
-                hire_date = employee.create_date.date()
-                if date_from <= hire_date <= date_to:
-                    dept_name = employee.department_id.name or 'No Department'
-                    onboarding_stats[dept_name] = onboarding_stats.get(dept_name, 0) + 1
-
-            departure_date = None
-            if hasattr(employee, 'departure_date') and employee.departure_date:
-                departure_date = employee.departure_date
-            elif not employee.active:
-                last_contract = self.env['hr.contract'].search([
-                    ('employee_id', '=', employee.id)
-                ], order='date_end desc', limit=1)
-                if last_contract and last_contract.date_end:
-                    departure_date = last_contract.date_end
-                else:
-                    departure_date = employee.write_date.date() if employee.write_date else None
-
-            if departure_date and date_from <= departure_date <= date_to:
-                dept_name = employee.department_id.name or 'No Department'
-                offboarding_stats[dept_name] = offboarding_stats.get(dept_name, 0) + 1
-
-            start_date = employee.create_date.date() if employee.create_date else None
-            end_date = departure_date
-            if end_date:
-                if end_date > date_to:
-                    report_data.append({
-                        'employee_name': employee.name,
-                        'department': employee.department_id.name or 'No Department',
-                        'job_title': employee.job_title or employee.job_id.name or '',
-                        'start_date': start_date.strftime('%Y-%m-%d') if start_date else '',
-                        'end_date': end_date.strftime('%Y-%m-%d') if end_date else 'Active',
-                    })
-            else:
-                if (start_date and date_from <= start_date <= date_to):
-                    report_data.append({
-                        'employee_name': employee.name,
-                        'department': employee.department_id.name or 'No Department',
-                        'job_title': employee.job_title or employee.job_id.name or '',
-                        'start_date': start_date.strftime('%Y-%m-%d') if start_date else '',
-                        'end_date': end_date.strftime('%Y-%m-%d') if end_date else 'Active',
-                    })
+    @api.model
+    def _get_report_stats(self, date_from, date_to, department_ids=None):
+        return self._get_cached_report(
+            'stats', date_from, date_to, department_ids,
+            partial(self._compute_report_stats, date_from, date_to, department_ids),
+        )
 
+    @api.model
+    def _compute_report_stats(self, date_from, date_to, department_ids=None):
+        department_counts = self._get_department_counts(date_from, date_to, department_ids)
+        department_names = self._get_department_names({row[0] for row in department_counts})
+
+        onboarding_stats = {}
+        offboarding_stats = {}
+        # Chart slices are keyed by name: keep the departments behind each for drill-down
+        slice_department_ids = {}
+        for department_id, onboarding_count, offboarding_count in department_counts:
+            dept_name = department_names[department_id]
+            slice_department_ids.setdefault(dept_name, []).append(department_id or False)
+            if onboarding_count:
+                onboarding_stats[dept_name] = onboarding_stats.get(dept_name, 0) + onboarding_count
+            if offboarding_count:
+                offboarding_stats[dept_name] = offboarding_stats.get(dept_name, 0) + offboarding_count
         return {
-            'employee_data': report_data,
             'onboarding_stats': onboarding_stats,
             'offboarding_stats': offboarding_stats,
+            'slice_department_ids': slice_department_ids,
+            'department_tree': self._get_department_tree(department_counts),
+        }
+
+    @api.model
+    def _get_department_tree(self, department_counts):
+        """Roll ``department_counts`` up the department hierarchy, keyed by department id.
+
+        Ancestors come from ``parent_path``, so every count is added to its department
+        and all of its ancestors in a single pass. Returns the nodes depth-first, with
+        siblings sorted by name::
+
+            [{'id': 1, 'name': 'R&D', 'parent_id': False, 'depth': 0, 'has_children': True,
+              'onboarding': 2, 'offboarding': 0, 'onboarding_total': 7, 'offboarding_total': 1}, ...]
+        """
+        departments = self.env['hr.department'].with_context(active_test=False).browse(
+            [row[0] for row in department_counts if row[0]]
+        )
+        paths = {
+            department.id: [int(ancestor_id) for ancestor_id in department.parent_path.split('/') if ancestor_id]
+            for department in departments
+        }
+
+        nodes = {}
+        for department_id, onboarding_count, offboarding_count in department_counts:
+            path = paths.get(department_id) or [None]
+            for depth, node_id in enumerate(path):
+                node = nodes.setdefault(node_id, {
+                    'id': node_id or False,
+                    'parent_id': path[depth - 1] if depth else False,
+                    'depth': depth,
+                    'path': path[:depth + 1],
+                    'has_children': False,
+                    'onboarding': 0,
+                    'offboarding': 0,
+                    'onboarding_total': 0,
+                    'offboarding_total': 0,
+                })
+                node['onboarding_total'] += onboarding_count
+                node['offboarding_total'] += offboarding_count
+                if depth:
+                    nodes[path[depth - 1]]['has_children'] = True
+            nodes[path[-1]]['onboarding'] += onboarding_count
+            nodes[path[-1]]['offboarding'] += offboarding_count
+
+        names = self._get_department_names(nodes)
+        tree = sorted(nodes.values(), key=lambda node: [(names[node_id], node_id or 0) for node_id in node['path']])
+        for node in tree:
+            node['name'] = names[node.pop('path')[-1]]
+        return tree
+
+    @api.model
+    def _get_employee_rows_condition_sql(self, date_from, date_to, event_type=None):
+        """Employees leaving after the period, or joining during it and still active.
+
+        With ``event_type``, employees hired (onboarding) or leaving (offboarding) during the period.
+        """
+        if event_type == 'onboarding':
+            return SQL("employee.hire_date BETWEEN %s AND %s", date_from, date_to)
+        if event_type == 'offboarding':
+            return SQL("employee.departure_date BETWEEN %s AND %s", date_from, date_to)
+        return SQL("""(
+            employee.departure_date > %(date_to)s
+            OR (employee.departure_date IS NULL AND employee.hire_date BETWEEN %(date_from)s AND %(date_to)s)
+        )""", date_from=date_from, date_to=date_to)
+
+    @api.model
+    def _get_employee_rows(self, date_from, date_to, department_ids=None, offset=0, limit=None,
+                           order='employee_name', direction='asc', search=None, employee_ids=None,
+                           event_type=None):
+        """Return ``(rows, total)`` for the employee table of the report.
+
+        ``order`` is one of the report columns; ``employee_ids`` optionally restricts
+        the rows to the given employees and ``event_type`` to one event of the period.
+        """
+        orders = {
+            'employee_name': SQL("employee.name"),
+            'department': self.env['hr.department']._field_to_sql('department', 'name'),
+            'job_title': SQL("COALESCE(employee.job_title, %s)", self.env['hr.job']._field_to_sql('job', 'name')),
+            'start_date': SQL("employee.hire_date"),
+            'end_date': SQL("employee.departure_date"),
+        }
+        order_by = SQL(
+            "%s %s NULLS LAST, employee.id",
+            orders.get(order, orders['employee_name']),
+            SQL("DESC") if direction == 'desc' else SQL("ASC"),
+        )
+        search_condition = SQL("employee.name ILIKE %s", f"%{search}%") if search else SQL("TRUE")
+
+        self.env.cr.execute(SQL("""
+            WITH employee AS (%(employees)s)
+            SELECT employee.name, employee.department_id, employee.job_title, employee.job_id,
+                   employee.hire_date, employee.departure_date, COUNT(*) OVER ()
+              FROM employee
+              LEFT JOIN hr_department department ON department.id = employee.department_id
+              LEFT JOIN hr_job job ON job.id = employee.job_id
+             WHERE %(condition)s AND %(search)s
+             ORDER BY %(order_by)s
+             LIMIT %(limit)s OFFSET %(offset)s
+        """, employees=self._get_employee_dates_sql(
+            department_ids, employee_ids, hired_between=(date_from, date_to) if event_type == 'onboarding' else None,
+        ),
+            condition=self._get_employee_rows_condition_sql(date_from, date_to, event_type),
+            search=search_condition, order_by=order_by, limit=limit, offset=offset))
+        rows = self.env.cr.fetchall()
+        total = rows[0][-1] if rows else 0
+        return [row[:-1] for row in rows], total
+
+    @api.model
+    def _iter_employee_rows(self, date_from, date_to, department_ids=None, chunk_size=2000):
+        """Yield the formatted employee table rows of ``get_report_data``, in the same order.
+
+        Only the ordered employee ids are loaded upfront; rows are then read and
+        formatted ``chunk_size`` employees at a time.
+        """
+        date_from = fields.Date.to_date(date_from)
+        date_to = fields.Date.to_date(date_to)
+        employee_ids = self._get_employee_row_ids(date_from, date_to, department_ids)
+        for chunk in split_every(chunk_size, employee_ids, list):
+            rows, _total = self._get_employee_rows(date_from, date_to, employee_ids=chunk)
+            yield from self._format_employee_rows(rows)
+
+    @api.model
+    def _get_employee_row_ids(self, date_from, date_to, department_ids=None):
+        """Return the ids of the employees of the report's table, ordered by name."""
+        self.env.cr.execute(SQL("""
+            WITH employee AS (%s)
+            SELECT employee.id FROM employee WHERE %s ORDER BY employee.name, employee.id
+        """, self._get_employee_dates_sql(department_ids),
+            self._get_employee_rows_condition_sql(date_from, date_to)))
+        return [row[0] for row in self.env.cr.fetchall()]
+
+    @api.model
+    def _format_employee_rows(self, rows):
+        department_names = self._get_department_names({row[1] for row in rows})
+        jobs = self.env['hr.job'].browse({row[3] for row in rows if row[3] and not row[2]})
+        job_names = {job.id: job.name for job in jobs}
+        return [{
+            'employee_name': name,
+            'department': department_names[department_id],
+            'job_title': job_title or job_names.get(job_id) or '',
+            'start_date': start_date.strftime('%Y-%m-%d') if start_date else '',
+            'end_date': end_date.strftime('%Y-%m-%d') if end_date else 'Active',
+        } for name, department_id, job_title, job_id, start_date, end_date in rows]
+
+    @api.model
+    def _encode_employee_rows(self, rows):
+        """Columnar encoding of formatted employee rows for the client::
+
+            {'length': 2, 'employee_name': ['Ann', 'Bob'], 'start_date': [...], 'end_date': [...],
+             'department': [0, 0], 'job_title': [0, 1], 'departments': ['R&D'], 'jobs': ['Dev', 'QA']}
+
+        Departments and job titles are dictionary-encoded: the columns hold indexes
+        into the ``departments`` and ``jobs`` tables.
+        """
+        departments = {}
+        jobs = {}
+        return {
+            'length': len(rows),
+            'employee_name': [row['employee_name'] for row in rows],
+            'department': [departments.setdefault(row['department'], len(departments)) for row in rows],
+            'job_title': [jobs.setdefault(row['job_title'], len(jobs)) for row in rows],
+            'start_date': [row['start_date'] for row in rows],
+            'end_date': [row['end_date'] for row in rows],
+            'departments': list(departments),
+            'jobs': list(jobs),
+        }
+
+    @api.model
+    def get_report_data(self, date_from, date_to, department_ids=None):
+        date_from = fields.Date.to_date(date_from)
+        date_to = fields.Date.to_date(date_to)
+        return self._get_cached_report(
+            'data', date_from, date_to, department_ids,
+            partial(self._compute_report_data, date_from, date_to, department_ids),
+        )
+
+    @api.model
+    def _compute_report_data(self, date_from, date_to, department_ids=None):
+        rows, _total = self._get_employee_rows(date_from, date_to, department_ids)
+        return {
+            'employee_data': self._format_employee_rows(rows),
+            **self._compute_report_stats(date_from, date_to, department_ids),
+        }
+
+    @api.model
+    def get_employee_page(self, date_from, date_to, department_ids=None, offset=0, limit=80,
+                          order='employee_name', direction='asc', search=None):
+        """Return one sorted/filtered page of the report's employee table, for the client action.
+
+        Rows are sent as ``{'columns': ..., 'total': ...}``, see ``_encode_employee_rows``.
+        """
+        rows, total = self._get_employee_rows(
+            fields.Date.to_date(date_from), fields.Date.to_date(date_to), department_ids,
+            offset=offset, limit=limit, order=order, direction=direction, search=search,
+        )
+        return {
+            'columns': self._encode_employee_rows(self._format_employee_rows(rows)),
+            'total': total,
+        }
+
+    @api.model
+    def get_slice_employees(self, date_from, date_to, department_ids, event_type, offset=0, limit=80):
+        """Return one page of the employees behind a chart slice, as ``{'columns', 'total'}``.
+
+        ``department_ids`` are the departments of the slice (``False`` for employees
+        without department) and ``event_type`` is ``onboarding`` or ``offboarding``.
+        """
+        if event_type not in ('onboarding', 'offboarding'):
+            return {'columns': self._encode_employee_rows([]), 'total': 0}
+        rows, total = self._get_employee_rows(
+            fields.Date.to_date(date_from), fields.Date.to_date(date_to), department_ids or [False],
+            offset=offset, limit=limit, event_type=event_type,
+        )
+        return {
+            'columns': self._encode_employee_rows(self._format_employee_rows(rows)),
+            'total': total,
+        }
+
+    @api.model
+    def get_headcount(self, as_of_dates, department_ids=None):
+        """Return the active headcount per department at each of ``as_of_dates``::
+
+            {'dates': ['2024-01-31', ...], 'departments': [{'id': 3, 'name': 'R&D', 'headcount': [...]}]}
+
+        Employees count from their hire date until the day before their departure date.
+        """
+        dates = sorted({fields.Date.to_date(as_of_date) for as_of_date in as_of_dates})
+        if not dates:
+            return {'dates': [], 'departments': []}
+        return self._get_cached_report(
+            ('headcount', tuple(dates)), None, None, department_ids,
+            partial(self._compute_headcount, dates, department_ids),
+        )
+
+    @api.model
+    def _compute_headcount(self, dates, department_ids=None):
+        # width_bucket numbers each fact with the first of the sorted dates it counts
+        # for, so a running sum over the buckets gives the headcount at every date
+        # in one scan of the facts, whatever the number of dates.
+        self.env['hr.onboarding.fact'].flush_model()
+        self.env.cr.execute(SQL("""
+            SELECT department_id, bucket,
+                   SUM(SUM(CASE WHEN event_type = 'onboarding' THEN count ELSE -count END))
+                       OVER (PARTITION BY department_id ORDER BY bucket)::integer
+              FROM (
+                    SELECT department_id, event_type, count, width_bucket(date, %s::date[]) AS bucket
+                      FROM hr_onboarding_fact
+                     WHERE date <= %s AND %s
+                   ) fact
+             GROUP BY department_id, bucket
+        """, [as_of_date + timedelta(days=1) for as_of_date in dates], dates[-1],
+            self._get_fact_domain_sql(department_ids)))
+        rows = self.env.cr.fetchall()
+
+        headcounts = {}
+        for department_id, bucket, headcount in rows:
+            headcounts.setdefault(department_id, [None] * len(dates))[bucket] = headcount
+        department_names = self._get_department_names(headcounts)
+        departments = []
+        for department_id, values in headcounts.items():
+            previous = 0
+            for index, value in enumerate(values):
+                previous = values[index] = previous if value is None else value
+            departments.append({
+                'id': department_id or False,
+                'name': department_names[department_id],
+                'headcount': values,
+            })
+        return {
+            'dates': [fields.Date.to_string(as_of_date) for as_of_date in dates],
+            'departments': sorted(departments, key=lambda department: department['name']),
+        }
+
+    @api.model
+    def get_trend_data(self, date_from, date_to, department_ids=None, interval='month'):
+        """Return hires and departures per ``interval`` bucket and department.
+
+        Aggregated in the database from the fact table with ``date_trunc``; every
+        bucket of the period is returned, including empty ones::
+
+            {'interval': 'month', 'buckets': ['2024-01-01', ...],
+             'departments': [{'id': 3, 'name': 'R&D', 'onboarding': [...], 'offboarding': [...]}]}
+        """
+        if interval not in TREND_INTERVAL_STEPS:
+            interval = 'month'
+        date_from = fields.Date.to_date(date_from)
+        date_to = fields.Date.to_date(date_to)
+        return self._get_cached_report(
+            ('trend', interval), date_from, date_to, department_ids,
+            partial(self._compute_trend_data, date_from, date_to, department_ids, interval),
+        )
+
+    @api.model
+    def _compute_trend_data(self, date_from, date_to, department_ids, interval):
+        self.env['hr.onboarding.fact'].flush_model()
+        self.env.cr.execute(SQL("""
+            SELECT bucket::date
+              FROM generate_series(date_trunc(%(interval)s, %(date_from)s::timestamp), %(date_to)s::timestamp,
+                                   %(step)s::interval) bucket
+        """, interval=interval, step=TREND_INTERVAL_STEPS[interval], date_from=date_from, date_to=date_to))
+        buckets = [row[0] for row in self.env.cr.fetchall()]
+        bucket_index = {bucket: index for index, bucket in enumerate(buckets)}
+
+        self.env.cr.execute(SQL("""
+            SELECT date_trunc(%s, date::timestamp)::date AS bucket, department_id,
+                   COALESCE(SUM(count) FILTER (WHERE event_type = 'onboarding'), 0),
+                   COALESCE(SUM(count) FILTER (WHERE event_type = 'offboarding'), 0)
+              FROM hr_onboarding_fact
+             WHERE date BETWEEN %s AND %s AND %s
+             GROUP BY bucket, department_id
+        """, interval, date_from, date_to, self._get_fact_domain_sql(department_ids)))
+        rows = self.env.cr.fetchall()
+
+        department_names = self._get_department_names({row[1] for row in rows})
+        departments = {}
+        for bucket, department_id, onboarding_count, offboarding_count in rows:
+            department = departments.setdefault(department_id, {
+                'id': department_id or False,
+                'name': department_names[department_id],
+                'onboarding': [0] * len(buckets),
+                'offboarding': [0] * len(buckets),
+            })
+            department['onboarding'][bucket_index[bucket]] = onboarding_count
+            department['offboarding'][bucket_index[bucket]] = offboarding_count
+
+        return {
+            'interval': interval,
+            'buckets': [bucket.strftime('%Y-%m-%d') for bucket in buckets],
+            'departments': sorted(departments.values(), key=lambda department: department['name']),
+        }
+
+    @api.model
+    def _get_comparison_period(self, date_from, date_to, compare_with):
+        """Return the ``(date_from, date_to)`` reference period to compare the report with."""
+        if compare_with == 'previous_year':
+            return date_from - relativedelta(years=1), date_to - relativedelta(years=1)
+        length = date_to - date_from + timedelta(days=1)
+        return date_from - length, date_to - length
+
+    @api.model
+    def get_comparison_data(self, date_from, date_to, compare_from, compare_to, department_ids=None):
+        """Compare the hires and departures of two periods per department.
+
+        Both periods are aggregated by the same query over the fact table::
+
+            {'period': ['2024-01-01', '2024-03-31'], 'reference_period': [...],
+             'departments': [{'id': 3, 'name': 'R&D', 'onboarding': 4, 'onboarding_reference': 2,
+                              'onboarding_delta': 2, 'onboarding_change': 100.0, ...}],
+             'total': {...}}
+
+        ``*_change`` is the percentage change, None when the reference count is 0.
+        """
+        date_from, date_to, compare_from, compare_to = map(
+            fields.Date.to_date, (date_from, date_to, compare_from, compare_to)
+        )
+        return self._get_cached_report(
+            ('comparison', compare_from, compare_to), date_from, date_to, department_ids,
+            partial(self._compute_comparison_data, date_from, date_to, compare_from, compare_to, department_ids),
+        )
+
+    @api.model
+    def _compute_comparison_data(self, date_from, date_to, compare_from, compare_to, department_ids=None):
+        self.env['hr.onboarding.fact'].flush_model()
+        self.env.cr.execute(SQL("""
+            SELECT department_id,
+                   COALESCE(SUM(count) FILTER (WHERE event_type = 'onboarding' AND %(current)s), 0),
+                   COALESCE(SUM(count) FILTER (WHERE event_type = 'onboarding' AND %(reference)s), 0),
+                   COALESCE(SUM(count) FILTER (WHERE event_type = 'offboarding' AND %(current)s), 0),
+                   COALESCE(SUM(count) FILTER (WHERE event_type = 'offboarding' AND %(reference)s), 0)
+              FROM hr_onboarding_fact
+             WHERE (%(current)s OR %(reference)s) AND %(domain)s
+             GROUP BY department_id
+        """, current=SQL("date BETWEEN %s AND %s", date_from, date_to),
+            reference=SQL("date BETWEEN %s AND %s", compare_from, compare_to),
+            domain=self._get_fact_domain_sql(department_ids)))
+        rows = self.env.cr.fetchall()
+
+        def compare(values, onboarding, onboarding_reference, offboarding, offboarding_reference):
+            for event_type, count, reference in (
+                ('onboarding', onboarding, onboarding_reference),
+                ('offboarding', offboarding, offboarding_reference),
+            ):
+                values[event_type] = count
+                values[f'{event_type}_reference'] = reference
+                values[f'{event_type}_delta'] = count - reference
+                values[f'{event_type}_change'] = round(100.0 * (count - reference) / reference, 1) if reference else None
+            return values
+
+        department_names = self._get_department_names({row[0] for row in rows})
+        departments = [
+            compare({'id': department_id or False, 'name': department_names[department_id]}, *counts)
+            for department_id, *counts in rows
+        ]
+        totals = [sum(row[index] for row in rows) for index in range(1, 5)]
+        return {
+            'period': [fields.Date.to_string(date_from), fields.Date.to_string(date_to)],
+            'reference_period': [fields.Date.to_string(compare_from), fields.Date.to_string(compare_to)],
+            'departments': sorted(departments, key=lambda department: department['name']),
+            'total': compare({}, *totals),
+        }
+
+    def action_generate_report_async(self):
+        """Queue the report for background generation and open its job."""
+        self.ensure_one()
+        job = self.env['hr.onboarding.report.job'].create({
+            'date_from': self.date_from,
+            'date_to': self.date_to,
+            'department_ids': [(6, 0, self.department_ids.ids)],
+            'report_mode': self.report_mode,
+            'trend_interval': self.trend_interval,
+            'compare_with': self.compare_with,
+        })
+        return {
+            'type': 'ir.actions.act_window',
+            'res_model': 'hr.onboarding.report.job',
+            'res_id': job.id,
+            'view_mode': 'form',
+            'views': [(False, 'form')],
+            'target': 'current',
         }
 
     def action_generate_report(self):
 
         department_ids = self.department_ids.ids if self.department_ids else None
-        report_data = self.get_report_data(self.date_from, self.date_to, department_ids)
+        report_data = self._get_report_stats(self.date_from, self.date_to, department_ids)
+        if self.report_mode == 'trend':
+            report_data = dict(report_data, trend_data=self.get_trend_data(
+                self.date_from, self.date_to, department_ids, self.trend_interval
+            ))
+        if self.compare_with != 'none':
+            report_data = dict(report_data, comparison_data=self.get_comparison_data(
+                self.date_from, self.date_to,
+                *self._get_comparison_period(self.date_from, self.date_to, self.compare_with),
+                department_ids,
+            ))
 
         return {
             'type': 'ir.actions.client',
@@ -97,6 +734,38 @@ class HROnboardingReport(models.TransientModel):
                 'report_data': report_data,
                 'date_from': self.date_from.strftime('%Y-%m-%d'),
                 'date_to': self.date_to.strftime('%Y-%m-%d'),
+                'department_ids': department_ids or [],
                 'departments': [d.name for d in self.department_ids] if self.department_ids else ['All Departments'],
             }
         }
+
+
+class HrEmployee(models.Model):
+    _inherit = 'hr.employee'
+
+    # Fields only displayed by the onboarding report; changes moving the facts
+    # invalidate the report from ``hr.onboarding.fact._add_events``
+    _ONBOARDING_REPORT_DISPLAY_FIELDS = {'name', 'job_id', 'job_title'}
+
+    def init(self):
+        super().init()
+        # Employees of a department hired in a period: report rows and chart drill-down
+        create_index(self.env.cr, 'hr_employee_department_id_create_date_index',
+                     self._table, ['department_id', 'create_date'])
+
+    def write(self, vals):
+        if self._ONBOARDING_REPORT_DISPLAY_FIELDS & set(vals):
+            self.env['hr.onboarding.report']._invalidate_report_cache(
+                [employee.department_id.id for employee in self]
+            )
+        return super().write(vals)
+
+
+class HrDepartment(models.Model):
+    _inherit = 'hr.department'
+
+    def write(self, vals):
+        # Department names and hierarchy are part of every report (names, tree)
+        if {'name', 'parent_id', 'company_id', 'active'} & set(vals):
+            self.env['hr.onboarding.report']._invalidate_report_cache()
+        return super().write(vals)
@@ -0,0 +1,246 @@
+import gzip
+import json
+import logging
+import time
+from datetime import timedelta
+
+from odoo import api, fields, models
+from odoo.tools import split_every
+
+_logger = logging.getLogger(__name__)
+
+
+class HROnboardingReportJob(models.Model):
+    """Onboarding report computed in the background by a cron.
+
+    Large reports would outlive the HTTP worker timeout when computed by the wizard.
+    Jobs are instead processed by ``cron_onboarding_report_jobs`` with the rights and
+    companies of the user who queued them; the statistics are stored as a gzipped
+    JSON attachment that the client action reads back, the employee table as
+    ``hr.onboarding.report.job.line`` records it pages through.
+    """
+    _name = 'hr.onboarding.report.job'
+    _description = 'HR Onboarding/Offboarding Report Job'
+    _order = 'id desc'
+
+    name = fields.Char('Name', compute='_compute_name', store=True)
+    user_id = fields.Many2one('res.users', string='Requested By', required=True, readonly=True,
+                              default=lambda self: self.env.user, ondelete='cascade')
+    company_ids = fields.Many2many('res.company', string='Companies', readonly=True,
+                                   default=lambda self: self.env.companies)
+    date_from = fields.Date('Start Date', required=True, readonly=True)
+    date_to = fields.Date('End Date', required=True, readonly=True)
+    department_ids = fields.Many2many('hr.department', string='Departments', readonly=True)
+    report_mode = fields.Selection([
+        ('summary', 'Summary'),
+        ('trend', 'Trend'),
+    ], string='Mode', required=True, default='summary', readonly=True)
+    trend_interval = fields.Selection([
+        ('week', 'Weekly'),
+        ('month', 'Monthly'),
+        ('quarter', 'Quarterly'),
+    ], string='Trend Interval', required=True, default='month', readonly=True)
+    compare_with = fields.Selection([
+        ('none', 'No Comparison'),
+        ('previous_period', 'Previous Period'),
+        ('previous_year', 'Same Period Last Year'),
+    ], string='Compare With', required=True, default='none', readonly=True)
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ], string='Status', default='pending', required=True, readonly=True)
+    progress = fields.Float('Progress', default=0.0, readonly=True)
+    employee_count = fields.Integer('Employees', readonly=True)
+    error = fields.Text('Error', readonly=True)
+    attachment_id = fields.Many2one('ir.attachment', string='Result', readonly=True, ondelete='set null')
+    line_ids = fields.One2many('hr.onboarding.report.job.line', 'job_id', string='Employees', readonly=True)
+    date_done = fields.Datetime('Finished On', readonly=True)
+
+    @api.depends('date_from', 'date_to')
+    def _compute_name(self):
+        for job in self:
+            job.name = f'Onboarding Report {job.date_from} - {job.date_to}'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        jobs = super().create(vals_list)
+        self.env.ref('custom_hr_module.cron_onboarding_report_jobs')._trigger()
+        return jobs
+
+    @api.model
+    def _cron_process_jobs(self, time_limit=240):
+        """Process the queued jobs, re-triggering itself when out of time."""
+        deadline = time.monotonic() + time_limit
+        for job in self.search([('state', 'in', ('pending', 'running'))], order='id'):
+            if time.monotonic() > deadline:
+                self.env.ref('custom_hr_module.cron_onboarding_report_jobs')._trigger()
+                return False
+            job._process()
+        return True
+
+    def _set_progress(self, progress):
+        self.progress = progress
+        self.env.cr.commit()
+
+    def _process(self, chunk_size=2000):
+        """Compute the report of the job and store it; failures are recorded on the job."""
+        self.ensure_one()
+        self.write({'state': 'running', 'progress': 0.0, 'error': False})
+        # Lines committed by an interrupted run are computed again
+        self.line_ids.sudo().unlink()
+        self.env.cr.commit()
+        try:
+            data = self._compute_result(chunk_size)
+            attachment = self.env['ir.attachment'].sudo().create({
+                'name': f'{self.name}.json.gz',
+                'raw': gzip.compress(json.dumps(data).encode()),
+                'mimetype': 'application/gzip',
+                'res_model': self._name,
+                'res_id': self.id,
+            })
+            self.write({
+                'state': 'done',
+                'progress': 100.0,
+                'employee_count': data.pop('employee_count'),
+                'attachment_id': attachment.id,
+                'date_done': fields.Datetime.now(),
+            })
+            self.env.cr.commit()
+        except Exception as e:
+            self.env.cr.rollback()
+            _logger.exception("Onboarding report job %s failed", self.id)
+            self.write({'state': 'failed', 'error': str(e)})
+            self.env.cr.commit()
+            return
+        self.user_id._bus_send('simple_notification', {
+            'type': 'success',
+            'title': 'Onboarding Report',
+            'message': f'{self.name} is ready.',
+        })
+
+    def _compute_result(self, chunk_size):
+        Report = self.env['hr.onboarding.report'].with_user(self.user_id).with_context(
+            allowed_company_ids=self.company_ids.ids or self.user_id.company_id.ids,
+        )
+        department_ids = self.department_ids.ids or None
+        data = Report._compute_report_stats(self.date_from, self.date_to, department_ids)
+        if self.report_mode == 'trend':
+            data['trend_data'] = Report._compute_trend_data(
+                self.date_from, self.date_to, department_ids, self.trend_interval
+            )
+        if self.compare_with != 'none':
+            data['comparison_data'] = Report._compute_comparison_data(
+                self.date_from, self.date_to,
+                *Report._get_comparison_period(self.date_from, self.date_to, self.compare_with),
+                department_ids,
+            )
+        self._set_progress(10.0)
+
+        employee_ids = Report._get_employee_row_ids(self.date_from, self.date_to, department_ids)
+        Line = self.env['hr.onboarding.report.job.line'].sudo()
+        done = 0
+        for chunk in split_every(chunk_size, employee_ids, list):
+            rows, _total = Report._get_employee_rows(self.date_from, self.date_to, employee_ids=chunk)
+            Line.create([{
+                'job_id': self.id,
+                'sequence': done + index,
+                'employee_name': row['employee_name'],
+                'department': row['department'],
+                'job_title': row['job_title'],
+                'start_date': row['start_date'] or False,
+                'end_date': row['end_date'] if row['end_date'] != 'Active' else False,
+            } for index, row in enumerate(Report._format_employee_rows(rows))])
+            done += len(chunk)
+            self._set_progress(10.0 + 90.0 * done / len(employee_ids))
+        data['employee_count'] = len(employee_ids)
+        return data
+
+    def _get_result(self):
+        self.ensure_one()
+        if self.state != 'done' or not self.attachment_id:
+            return {}
+        return json.loads(gzip.decompress(self.attachment_id.sudo().raw))
+
+    def action_open_report(self):
+        """Open the stored result in the report client action."""
+        self.ensure_one()
+        report_data = self._get_result()
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'hr_onboarding_report_action',
+            'context': {
+                'report_data': report_data,
+                'report_job_id': self.id,
+                'date_from': self.date_from.strftime('%Y-%m-%d'),
+                'date_to': self.date_to.strftime('%Y-%m-%d'),
+                'department_ids': self.department_ids.ids,
+                'departments': self.department_ids.mapped('name') or ['All Departments'],
+            }
+        }
+
+    def action_retry(self):
+        self.write({'state': 'pending', 'progress': 0.0, 'error': False})
+        self.env.ref('custom_hr_module.cron_onboarding_report_jobs')._trigger()
+
+    def get_employee_page(self, offset=0, limit=80, order='employee_name', direction='asc', search=None):
+        """Same as ``hr.onboarding.report.get_employee_page``, served from the stored lines."""
+        self.ensure_one()
+        self.check_access('read')
+        Line = self.env['hr.onboarding.report.job.line'].sudo()
+        domain = [('job_id', '=', self.id)]
+        if search:
+            domain.append(('employee_name', 'ilike', search))
+        if order not in Line._PAGE_FIELDS:
+            order = 'sequence'
+        direction = 'desc' if direction == 'desc' else 'asc'
+        lines = Line.search_fetch(
+            domain, Line._PAGE_FIELDS,
+            offset=offset, limit=limit or None, order=f'{order} {direction}, sequence',
+        )
+        return {
+            'columns': self.env['hr.onboarding.report']._encode_employee_rows(lines._format_rows()),
+            'total': Line.search_count(domain),
+        }
+
+    @api.autovacuum
+    def _gc_report_jobs(self):
+        """Delete finished jobs and their results after a week."""
+        self.search([
+            ('state', 'in', ('done', 'failed')),
+            ('write_date', '<', fields.Datetime.now() - timedelta(days=7)),
+        ]).unlink()
+
+    def unlink(self):
+        self.attachment_id.sudo().unlink()
+        return super().unlink()
+
+
+class HROnboardingReportJobLine(models.Model):
+    """One row of the employee table of a report job, so the table is paged in SQL."""
+    _name = 'hr.onboarding.report.job.line'
+    _description = 'HR Onboarding/Offboarding Report Job Line'
+    _order = 'job_id, sequence'
+    _log_access = False
+
+    _PAGE_FIELDS = ['employee_name', 'department', 'job_title', 'start_date', 'end_date']
+
+    job_id = fields.Many2one('hr.onboarding.report.job', string='Job', required=True,
+                             index=True, ondelete='cascade')
+    sequence = fields.Integer('Sequence', required=True)
+    employee_name = fields.Char('Employee')
+    department = fields.Char('Department')
+    job_title = fields.Char('Job Position')
+    start_date = fields.Date('Start Date')
+    end_date = fields.Date('End Date')
+
+    def _format_rows(self):
+        """Rows shaped like ``hr.onboarding.report._format_employee_rows``."""
+        return [{
+            'employee_name': line.employee_name or '',
+            'department': line.department or '',
+            'job_title': line.job_title or '',
+            'start_date': line.start_date.strftime('%Y-%m-%d') if line.start_date else '',
+            'end_date': line.end_date.strftime('%Y-%m-%d') if line.end_date else 'Active',
+        } for line in self]
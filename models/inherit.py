@@ -2,11 +2,83 @@ import logging
 
 _logger = logging.getLogger(__name__)
 
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from odoo.exceptions import ValidationError
+from odoo.tools import SQL
 import re
 
 
+class EmployeeIdFormatter:
+    """Formats and parses Employee IDs for one set of ``employee_id_format.*`` parameters.
+
+    Instances are cached per registry by ``hr.employee._get_employee_id_formatter`` and
+    memoise the sanitised prefixes/suffixes of employees, which are shared by most
+    employees of a batch. Parsed values are never memoised: they come from user input.
+    """
+
+    NUMBER_WIDTHS = {'{:03d}': 3, '{:04d}': 4, '{:05d}': 5, '{}': 0}
+
+    def __init__(self, default_prefix, default_suffix, number_format):
+        self._sanitized = {}
+        self.number_format = number_format
+        self.number_width = self.NUMBER_WIDTHS.get(number_format, 3)
+        self.default_prefix = self.sanitize(default_prefix)
+        self.default_suffix = self.sanitize(default_suffix)
+
+    def sanitize(self, value):
+        value = value or ''
+        part = self._sanitized.get(value)
+        if part is None:
+            part = self._sanitized[value] = re.sub(r'[^A-Za-z0-9_]', '', value).upper()
+        return part
+
+    def format_number(self, record_id):
+        try:
+            return self.number_format.format(record_id)
+        except (ValueError, TypeError) as e:
+            _logger.error(
+                "Error formatting employee ID number %s with format '%s': %s. Using default format.",
+                record_id, self.number_format, str(e)
+            )
+            return "{:03d}".format(record_id)
+
+    def format(self, record_id, prefix=None, suffix=None):
+        """Return the Employee ID, with ``---`` as number for records not saved yet."""
+        prefix = self.sanitize(prefix) if prefix else self.default_prefix
+        suffix = self.sanitize(suffix) if suffix else self.default_suffix
+        employee_id_parts = [prefix, self.format_number(record_id) if record_id else "---"]
+        if suffix:
+            employee_id_parts.append(suffix)
+        return "-".join(employee_id_parts)
+
+    def format_records(self, employees):
+        """Return ``{record.id: employee ID}`` for a whole ``hr.employee`` recordset."""
+        return {
+            employee.id: self.format(employee._origin.id, employee.employee_id_prefix, employee.employee_id_suffix)
+            for employee in employees
+        }
+
+    def parse(self, employee_id):
+        """Split a formatted Employee ID into ``(prefix, record_id, suffix)``.
+
+        The number part must match the number format exactly, e.g. ``EMP-0042-HR``
+        only parses when the format is ``{:04d}``.
+        Returns None when the value cannot be an Employee ID.
+        """
+        parts = (employee_id or '').strip().upper().split('-')
+        if len(parts) not in (2, 3):
+            return None
+        prefix, number = parts[0], parts[1]
+        suffix = parts[2] if len(parts) == 3 else ''
+        if not number.isdigit() or not int(number):
+            return None
+        if number != self.format_number(int(number)):
+            return None
+        if not re.fullmatch(r'[A-Z0-9_]*', prefix) or not re.fullmatch(r'[A-Z0-9_]*', suffix):
+            return None
+        return prefix, int(number), suffix
+
+
 class HrEmployee(models.Model):
     _inherit = 'hr.employee'
 
@@ -14,8 +86,10 @@ class HrEmployee(models.Model):
         string='Employee ID',
         help='Automatically generated Employee Identification Number based on prefix, employee database ID, and suffix',
         compute='_compute_employee_id',
-        store=False,
-        search='_search_employee_id'
+        store=True,
+        index=True,
+        readonly=True,
+        copy=False,
     )
     employee_id_prefix = fields.Char(
         string='ID Prefix',
@@ -31,82 +105,144 @@ class HrEmployee(models.Model):
 
     @api.depends('employee_id_prefix', 'employee_id_suffix')
     def _compute_employee_id(self):
+        # Default prefix/suffix/format changes are applied by hr.employee.id.migration
+        employee_ids = self._get_employee_id_formatter().format_records(self)
         for record in self:
-            record_id = None
-
-            if hasattr(record.id, 'origin') and record.id.origin:
-                record_id = record.id.origin
-            elif isinstance(record.id, int) and record.id > 0:
-                record_id = record.id
-            elif hasattr(record, '_origin') and record._origin.id:
-                record_id = record._origin.id
-
-            if record_id:
-                prefix = record.employee_id_prefix or self._get_default_prefix()
-                prefix = re.sub(r'[^A-Za-z0-9_]', '', prefix).upper()
-
-                suffix = record.employee_id_suffix or self._get_default_suffix()
-                suffix = re.sub(r'[^A-Za-z0-9_]', '', suffix).upper()
-
-                number_format = self._get_number_format()
-                try:
-                    if number_format == '{}':
-                        formatted_number = str(record_id)
-                    else:
-                        formatted_number = number_format.format(record_id)
-
-                    employee_id_parts = [prefix, formatted_number]
-                    if suffix:
-                        employee_id_parts.append(suffix)
-
-                    record.employee_id = "-".join(employee_id_parts)
-                except (ValueError, TypeError) as e:
-                    _logger.error(
-                        "Error formatting employee ID number %s with format '%s': %s. Using default format.",
-                        record_id, number_format, str(e)
-                    )
-
-                    formatted_number = "{:03d}".format(record_id)
-                    employee_id_parts = [prefix, formatted_number]
-                    if suffix:
-                        employee_id_parts.append(suffix)
-
-                    record.employee_id = "-".join(employee_id_parts)
+            record.employee_id = employee_ids[record.id]
+
+    @api.model
+    @tools.ormcache()
+    def _get_employee_id_formatter(self):
+        """Formatter for the current ID format, shared by the registry until the settings change."""
+        return EmployeeIdFormatter(self._get_default_prefix(), self._get_default_suffix(), self._get_number_format())
+
+    @api.model
+    def resolve_employee_ids(self, formatted_ids):
+        """Map formatted Employee IDs (e.g. ``DEV-01234-TMP``) back to employees.
+
+        Every value is parsed against the configured format and all of them are
+        resolved with a single query, archived employees included. Returns a dict with:
+
+        - ``matched``: ``{formatted ID: employee id}``
+        - ``unparsed``: values that cannot be an Employee ID with the current format
+        - ``not_found``: well-formed values that no employee carries, e.g. the number
+          exists but belongs to an employee with another prefix or suffix
+        """
+        formatter = self._get_employee_id_formatter()
+        unparsed = []
+        parsed = {}
+        for formatted_id in formatted_ids:
+            parts = formatter.parse(formatted_id)
+            if parts:
+                parsed[formatted_id] = parts
             else:
-                prefix = record.employee_id_prefix or self._get_default_prefix()
-                prefix = re.sub(r'[^A-Za-z0-9_]', '', prefix).upper()
-
-                suffix = record.employee_id_suffix or self._get_default_suffix()
-                suffix = re.sub(r'[^A-Za-z0-9_]', '', suffix).upper()
-
-                employee_id_parts = [prefix, "---"]
-                if suffix:
-                    employee_id_parts.append(suffix)
+                unparsed.append(formatted_id)
 
-                record.employee_id = "-".join(employee_id_parts)
-
-    def _search_employee_id(self, operator, value):
-        if operator in ('=', '!=', 'like', 'ilike', 'in', 'not in'):
-            all_employees = self.search([])
-            matching_ids = []
-
-            for employee in all_employees:
-                computed_id = employee.employee_id
-                if operator == '=' and computed_id == value:
-                    matching_ids.append(employee.id)
-                elif operator == '!=' and computed_id != value:
-                    matching_ids.append(employee.id)
-                elif operator in ('like', 'ilike'):
-                    if value.lower() in computed_id.lower():
-                        matching_ids.append(employee.id)
-                elif operator == 'in' and computed_id in value:
-                    matching_ids.append(employee.id)
-                elif operator == 'not in' and computed_id not in value:
-                    matching_ids.append(employee.id)
-
-            return [('id', 'in', matching_ids)]
-
-        return [('id', '=', -1)]  # Return empty result for unsupported operators
+        employees = self.with_context(active_test=False).search_fetch(
+            [('id', 'in', list({parts[1] for parts in parsed.values()}))],
+            ['employee_id_prefix', 'employee_id_suffix'],
+        )
+        employee_ids = {
+            employee.id: formatter.format(employee.id, employee.employee_id_prefix, employee.employee_id_suffix)
+            for employee in employees
+        }
+
+        matched = {}
+        not_found = []
+        for formatted_id, (prefix, record_id, suffix) in parsed.items():
+            if employee_ids.get(record_id) == formatted_id.strip().upper():
+                matched[formatted_id] = record_id
+            else:
+                not_found.append(formatted_id)
+        return {'matched': matched, 'unparsed': unparsed, 'not_found': not_found}
+
+    @api.model
+    def _recompute_employee_id_codes(self, after_id=0, upto_id=None):
+        """Rewrite the stored Employee IDs of ``after_id < id <= upto_id`` in one statement.
+
+        Mirrors ``_compute_employee_id`` in SQL so that large employee tables are
+        not loaded into Python when the default prefix, suffix or number format changes.
+        Returns the ``(id, old ID, new ID)`` rows that actually changed.
+        """
+        self.flush_model(['employee_id_prefix', 'employee_id_suffix', 'employee_id'])
+        formatter = self._get_employee_id_formatter()
+        self.env.cr.execute("""
+            UPDATE hr_employee e
+               SET employee_id = c.code
+              FROM (
+                    SELECT id,
+                           employee_id AS old_code,
+                           CONCAT_WS(
+                               '-',
+                               UPPER(REGEXP_REPLACE(COALESCE(NULLIF(employee_id_prefix, ''), %(prefix)s),
+                                                    '[^A-Za-z0-9_]', '', 'g')),
+                               LPAD(id::text, GREATEST(%(width)s, LENGTH(id::text)), '0'),
+                               NULLIF(UPPER(REGEXP_REPLACE(COALESCE(NULLIF(employee_id_suffix, ''), %(suffix)s),
+                                                           '[^A-Za-z0-9_]', '', 'g')), '')
+                           ) AS code
+                      FROM hr_employee
+                     WHERE id > %(after_id)s
+                       AND (%(upto_id)s IS NULL OR id <= %(upto_id)s)
+                   ) c
+             WHERE c.id = e.id
+               AND e.employee_id IS DISTINCT FROM c.code
+         RETURNING c.id, c.old_code, c.code
+        """, {
+            'prefix': formatter.default_prefix,
+            'suffix': formatter.default_suffix,
+            'width': formatter.number_width,
+            'after_id': after_id,
+            'upto_id': upto_id,
+        })
+        changes = self.env.cr.fetchall()
+        self.invalidate_model(['employee_id'])
+        return changes
+
+    @api.model
+    def _get_departure_date_sql(self, employee_ids):
+        """SQL query returning ``(employee_id, departure_date)`` for ``employee_ids``.
+
+        ``employee_ids`` is an SQL tuple or subquery of hr.employee ids. The departure
+        date is the employee's ``departure_date``; for archived employees without one,
+        the end of their latest contract (open-ended contracts first, like the ORM
+        ordering did), then their last modification date.
+        """
+        self.flush_model(['active', 'departure_date', 'write_date'])
+        self.env['hr.contract'].flush_model(['employee_id', 'date_end', 'active'])
+        last_contract = SQL("""
+            SELECT DISTINCT ON (employee_id) employee_id, date_end
+              FROM hr_contract
+             WHERE active AND employee_id IN %s
+             ORDER BY employee_id, date_end DESC
+        """, employee_ids)
+        return SQL("""
+            SELECT e.id AS employee_id,
+                   COALESCE(
+                       e.departure_date,
+                       CASE WHEN NOT e.active THEN COALESCE(c.date_end, e.write_date::date) END
+                   ) AS departure_date
+              FROM hr_employee e
+              LEFT JOIN (%s) c ON c.employee_id = e.id
+             WHERE e.id IN %s
+        """, last_contract, employee_ids)
+
+    def _get_departure_dates(self):
+        """Return the effective departure date of each employee, ``{employee id: date or None}``.
+
+        Resolved with a single query and memoised for the current transaction, so that
+        reports, exports and turnover metrics share the result. The onboarding fact
+        hooks of employees and contracts clear the memo (``_invalidate_departure_dates``).
+        """
+        cache = self.env.cr.precommit.data.setdefault('hr.employee.departure_dates', {})
+        missing = tuple(employee_id for employee_id in self.ids if employee_id not in cache)
+        if missing:
+            self.env.cr.execute(self._get_departure_date_sql(SQL("%s", missing)))
+            cache.update(self.env.cr.fetchall())
+        return {employee_id: cache.get(employee_id) for employee_id in self.ids}
+
+    @api.model
+    def _invalidate_departure_dates(self):
+        self.env.cr.precommit.data.pop('hr.employee.departure_dates', None)
 
     def _get_default_prefix(self):
         return self.env['ir.config_parameter'].sudo().get_param(
@@ -165,24 +301,22 @@ class HrEmployeePublicInherit(models.Model):
         string='Custom Employee ID',
         help='Displays the computed Employee ID from the hr.employee model',
         compute='_compute_employee_id_public_field',
+        search='_search_employee_id_public',
         store=False,
     )
 
     def _compute_employee_id_public_field(self):
-
+        # Public records share their id with hr.employee: read the whole batch at once
+        employees = self.env['hr.employee'].sudo().browse(self.ids).exists()
+        employee_ids = dict(zip(employees.ids, employees.mapped('employee_id')))
         for record in self:
-            try:
-                employee = self.env['hr.employee'].sudo().browse(record.id)
-                if employee.exists() and employee.employee_id:
-                    record.employee_id_public = employee.employee_id
-                else:
-                    record.employee_id_public = False
-            except Exception as e:
-                _logger.error(
-                    "Error computing 'employee_id_public' field for public record %s: %s",
-                    record.id, str(e)
-                )
-                record.employee_id_public = False
+            record.employee_id_public = employee_ids.get(record.id, False)
+
+    def _search_employee_id_public(self, operator, value):
+        employee_query = self.env['hr.employee'].sudo().with_context(active_test=False)._search(
+            [('employee_id', operator, value)]
+        )
+        return [('id', 'in', employee_query)]
 
 
 class InheritIrModelFields(models.Model):
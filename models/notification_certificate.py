@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta
 from odoo import api, fields, models
+from odoo.osv import expression
+from odoo.tools import SQL
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,106 +26,19 @@ class CertificateNotificationRecord(models.Model):
     certificate_name = fields.Char('Certificate Name', help='Backup name in case certificate record is deleted')
     certificate_description = fields.Text('Certificate Description', help='Backup description')
 
-    @api.depends('employee_id', 'certificate_id', 'certificate_name')
+    @api.depends('employee_id.name', 'certificate_id.name', 'certificate_name')
     def _compute_display_name(self):
+        # No cleanup here: deleted certificates are nulled by the foreign key (ondelete='set null')
         for record in self:
-            try:
-                if record.employee_id:
-                    employee_name = record.employee_id.name or "Unknown Employee"
-
-                    # Try to get certificate name from the linked record first
-                    certificate_name = None
-                    if record.certificate_id:
-                        try:
-                            # Test if the certificate record exists and is accessible
-                            if hasattr(record.certificate_id, 'exists') and record.certificate_id.exists():
-                                certificate_name = (
-                                        getattr(record.certificate_id, 'name', None) or
-                                        getattr(record.certificate_id, 'display_name', None) or
-                                        getattr(record.certificate_id, 'description', None)
-                                )
-                            else:
-                                # Certificate record doesn't exist, clear the reference
-                                logger.info(
-                                    f"Certificate record doesn't exist for notification {record.id}, clearing reference")
-                                record._clear_broken_certificate_reference()
-                                certificate_name = None
-                        except Exception as e:
-                            logger.warning(f"Error accessing certificate_id for record {record.id}: {e}")
-                            # Clear broken reference
-                            record._clear_broken_certificate_reference()
-                            certificate_name = None
-
-                    # Fallback to stored certificate name
-                    if not certificate_name:
-                        certificate_name = record.certificate_name or f"Certificate (Deleted)"
-
-                    computed_name = f"{employee_name} - {certificate_name}"
-                    record.display_name = computed_name
-                    record.name = computed_name
-                else:
-                    record.display_name = "Certificate Notification"
-                    record.name = "Certificate Notification"
-            except Exception as e:
-                logger.warning(f"Error computing display_name for record {record.id}: {e}")
-                record.display_name = "Certificate Notification"
-                record.name = "Certificate Notification"
-
-    def _clear_broken_certificate_reference(self):
-        """Safely clear broken certificate reference"""
-        try:
-            self.env.cr.execute("""
-                UPDATE certificate_notification_record 
-                SET certificate_id = NULL 
-                WHERE id = %s
-            """, (self.id,))
-            self.env.cr.commit()
-        except Exception as e:
-            logger.error(f"Failed to clear broken reference for record {self.id}: {e}")
-            self.env.cr.rollback()
-
-    def web_read(self, specification):
-        """Override web_read to handle broken references in web interface"""
-        # Clean broken references before web read
-        self._cleanup_broken_references()
-        try:
-            return super().web_read(specification)
-        except (AttributeError, TypeError) as e:
-            if "'_unknown' object has no attribute" in str(e):
-                logger.warning(f"Broken reference in web_read: {e}")
-                # Clean again and retry
-                self._cleanup_broken_references()
-                self.env.invalidate_all()
-                try:
-                    return super().web_read(specification)
-                except Exception:
-                    # Return safe minimal data
-                    return []
-
-    @api.model
-    def search_read(self, domain=None, fields=None, offset=0, limit=None, order=None):
-        """Override search_read to handle broken references in searches"""
-        try:
-            # First do a normal search to get the IDs
-            ids = self.search(domain or [], offset=offset, limit=limit, order=order)
-            # Clean any broken references in the found records
-            if ids:
-                ids._cleanup_broken_references()
-            # Then read the cleaned records
-            return ids.read(fields)
-        except Exception as e:
-            logger.error(f"Error in search_read: {e}")
-            # Fallback to minimal search without problematic records
-            try:
-                # Search for records that definitely don't have broken references
-                safe_domain = (domain or []) + [
-                    '|',
-                    ('certificate_id', '=', False),
-                    ('certificate_id', 'in', self.env['hr.resume.line'].search([]).ids)
-                ]
-                return super().search_read(safe_domain, fields, offset, limit, order)
-            except Exception:
-                return []
+            if record.employee_id:
+                employee_name = record.employee_id.name or "Unknown Employee"
+                # Fallback to stored certificate name
+                certificate_name = record.certificate_id.name or record.certificate_name or "Certificate (Deleted)"
+                computed_name = f"{employee_name} - {certificate_name}"
+            else:
+                computed_name = "Certificate Notification"
+            record.display_name = computed_name
+            record.name = computed_name
 
     @api.depends('expiry_date')
     def _compute_days_remaining(self):
@@ -156,79 +71,32 @@ class CertificateNotificationRecord(models.Model):
             'target': 'current',
         }
 
-    @api.model
-    def create(self, vals):
+    @api.model_create_multi
+    def create(self, vals_list):
         """Override create to store certificate info as backup"""
-        record = super().create(vals)
         # Store certificate name as backup in case the certificate record gets deleted
-        if record.certificate_id:
-            try:
-                if record.certificate_id.exists():
-                    certificate_name = (
-                            getattr(record.certificate_id, 'name', None) or
-                            getattr(record.certificate_id, 'display_name', None) or
-                            getattr(record.certificate_id, 'description', None) or
-                            f"Certificate {record.certificate_id.id}"
-                    )
-                    record.certificate_name = certificate_name
-                    record.certificate_description = getattr(record.certificate_id, 'description', '')
-            except Exception as e:
-                logger.warning(f"Error storing certificate backup info: {e}")
-        return record
-
-    def read(self, fields=None, load='_classic_read'):
-        """Override read to handle broken certificate references more robustly"""
-        # First, try to clean any broken references in this recordset
-        self._cleanup_broken_references()
-
-        try:
-            return super().read(fields, load)
-        except (AttributeError, TypeError) as e:
-            if "'_unknown' object has no attribute" in str(e):
-                logger.warning(f"Broken certificate reference detected in notification records: {e}")
-
-                # Force cleanup and try again
-                self._cleanup_broken_references()
-
-                try:
-                    # Clear cache and try reading again
-                    self.env.invalidate_all()
-                    return super().read(fields, load)
-                except Exception as retry_error:
-                    logger.error(f"Failed to read after cleanup: {retry_error}")
-                    # Return minimal safe data as fallback
-                    if fields:
-                        return [{field: False if field != 'id' else rec_id for field in fields}
-                                for rec_id in self.ids]
-                    else:
-                        return [{'id': rec_id, 'display_name': 'Broken Notification Record'}
-                                for rec_id in self.ids]
-            raise
-
-    def _cleanup_broken_references(self):
-        """Helper method to clean broken references for this recordset"""
-        if not self.ids:
-            return
-
-        try:
-            # Use SQL to directly fix broken references without triggering ORM issues
-            self.env.cr.execute("""
-                UPDATE certificate_notification_record 
-                SET certificate_id = NULL 
-                WHERE id IN %s 
-                AND certificate_id IS NOT NULL 
-                AND certificate_id NOT IN (
-                    SELECT id FROM hr_resume_line WHERE id IS NOT NULL
-                )
-            """, (tuple(self.ids),))
-
-            if self.env.cr.rowcount > 0:
-                logger.info(f"Cleared {self.env.cr.rowcount} broken certificate references")
-                self.env.cr.commit()
-
-        except Exception as sql_error:
-            logger.error(f"Error during broken reference cleanup: {sql_error}")
-            self.env.cr.rollback()
+        certificates = self.env['hr.resume.line'].browse(
+            {vals['certificate_id'] for vals in vals_list if vals.get('certificate_id')}
+        ).exists()
+        NotificationCertificate = self.env['notification.certificate']
+        for vals in vals_list:
+            certificate = certificates.browse(vals.get('certificate_id')) & certificates
+            if certificate:
+                if not vals.get('certificate_name'):
+                    vals['certificate_name'] = NotificationCertificate._get_certificate_name(certificate)
+                vals.setdefault('certificate_description', certificate.description or '')
+        return super().create(vals_list)
+
+    def write(self, vals):
+        # Keep the backup certificate info in sync with the referenced certificate
+        if vals.get('certificate_id') and not vals.get('certificate_name'):
+            certificate = self.env['hr.resume.line'].browse(vals['certificate_id'])
+            vals = dict(
+                vals,
+                certificate_name=self.env['notification.certificate']._get_certificate_name(certificate),
+                certificate_description=certificate.description or '',
+            )
+        return super().write(vals)
 
     @api.model
     def default_get(self, fields_list):
@@ -245,6 +113,55 @@ class CertificateNotificationRecord(models.Model):
         return self.action_view_certificate()
 
 
+class CertificateNotificationLog(models.Model):
+    """Expiry notifications already sent, one per certification, manager, expiry date and tier.
+
+    The unique key outlives the activities themselves, which are deleted once done.
+    A renewed certification has a new expiry date, so it is notified again.
+    """
+    _name = 'certificate.notification.log'
+    _description = 'Certificate Expiry Notification Log'
+    _log_access = False
+
+    notification_record_id = fields.Many2one('certificate.notification.record', string='Notification',
+                                             required=True, ondelete='cascade')
+    user_id = fields.Many2one('res.users', string='Notified User', required=True, ondelete='cascade')
+    expiry_date = fields.Date('Expiry Date')
+    tier = fields.Integer('Days Before Expiry', required=True)
+    date = fields.Date('Notified On', default=fields.Date.today)
+
+    _sql_constraints = [
+        ('notification_user_tier_uniq', 'UNIQUE(notification_record_id, user_id, expiry_date, tier)',
+         'A notification is only sent once per certification, user, expiry date and tier.'),
+    ]
+
+    @api.model
+    def _claim(self, keys):
+        """Log the ``(notification record id, user id, expiry date, tier)`` keys not logged yet, and return them."""
+        if not keys:
+            return []
+        notification_record_ids, user_ids, expiry_dates, tiers = zip(*keys)
+        self.env.cr.execute("""
+            INSERT INTO certificate_notification_log (notification_record_id, user_id, expiry_date, tier, date)
+            SELECT *, CURRENT_DATE FROM unnest(%s::integer[], %s::integer[], %s::date[], %s::integer[])
+                ON CONFLICT (notification_record_id, user_id, expiry_date, tier) DO NOTHING
+            RETURNING notification_record_id, user_id, expiry_date, tier
+        """, (list(notification_record_ids), list(user_ids), list(expiry_dates), list(tiers)))
+        return [tuple(row) for row in self.env.cr.fetchall()]
+
+
+class CertificateProcessingState(models.Model):
+    """Watermark of ``notification.certificate.process_certificate``, a single record.
+
+    Not a system parameter: setting those clears the caches of every worker. Only
+    readable by HR managers and written with sudo by the cron and the settings.
+    """
+    _name = 'certificate.processing.state'
+    _description = 'Certificate Processing State'
+
+    last_processed_at = fields.Datetime('Last Processed At', readonly=True)
+
+
 class NotificationCertificate(models.Model):
     _name = 'notification.certificate'
     _description = 'Notification Certificate'
@@ -252,11 +169,52 @@ class NotificationCertificate(models.Model):
 
     name = fields.Char('Name', required=True, default='Certificate')
 
+    @api.model
+    def _get_processing_state(self):
+        """Return the processing state (sudo); a missing one is recreated, making the next run a full one."""
+        State = self.env['certificate.processing.state'].sudo()
+        return State.search([], order='id', limit=1) or State.create({})
+
+    @api.model
+    def _get_certificate_end_date_field(self):
+        """Name of the expiry date field of ``hr.resume.line``, None if there is none."""
+        resume_model = self.env['hr.resume.line']
+        for field_name in ['date_end', 'end_date', 'date_to', 'validity_end']:
+            if field_name in resume_model._fields:
+                return field_name
+        return None
+
+    @api.model
+    def _get_certificate_name(self, certificate):
+        return certificate.name or certificate.display_name or certificate.description or f"Certificate {certificate.id}"
+
+    @api.model
+    def _get_notification_tiers(self):
+        """Days before expiry at which managers are notified, in ascending order."""
+        tiers = self.env['ir.config_parameter'].sudo().get_param(
+            'custom_hr_module.certificate_notification_tiers', '60,30,7,1'
+        )
+        return sorted({int(tier) for tier in tiers.split(',') if tier.strip().isdigit() and int(tier) > 0}) or [30]
+
     @api.model
     def process_certificate(self):
+        """Notify the managers of employees whose certifications reach a notification tier.
+
+        A certification expiring in N days is in the smallest tier (see
+        ``_get_notification_tiers``) of at least N days; each manager gets at most one
+        activity per certification and tier, recorded in ``certificate.notification.log``.
+
+        Certificates, employees and managers are fetched upfront, existing notification
+        records are looked up in a dict, and the missing records and activities are
+        created in bulk: the number of queries does not depend on the number of certificates.
+
+        Runs are incremental: past the first one, only certifications changed since the
+        previous run (``last_processed_at``), or which entered a new tier since then, are
+        examined.
+        """
         logger.info("Starting certificate processing...")
         today = fields.Date.today()
-        thirty_days_from_now = today + timedelta(days=30)
+        tiers = self._get_notification_tiers()
 
         # Check if hr.resume.line model exists (Skills Management must be enabled)
         if 'hr.resume.line' not in self.env:
@@ -264,136 +222,126 @@ class NotificationCertificate(models.Model):
                 "hr.resume.line model not found. Please enable Skills Management in Employees app → Configuration → Settings")
             return False
 
-        # Try different possible field names for the end date
-        end_date_field = None
-        possible_end_date_fields = ['date_end', 'end_date', 'date_to', 'validity_end']
-
-        resume_model = self.env['hr.resume.line']
-        for field_name in possible_end_date_fields:
-            if field_name in resume_model._fields:
-                end_date_field = field_name
-                logger.info(f"Found end date field: {field_name}")
-                break
-
+        end_date_field = self._get_certificate_end_date_field()
         if not end_date_field:
             logger.error("Could not find end date field in hr.resume.line model")
             return False
 
-        # Search for certifications expiring in the next 30 days
-        records = self.env['hr.resume.line'].search([
-            ('display_type', '=', 'certification'),
-            (end_date_field, '>', today),
-            (end_date_field, '<=', thirty_days_from_now)
-        ])
-
         activity_type = self.env.ref('mail.mail_activity_data_warning', raise_if_not_found=False)
         if not activity_type:
             logger.warning("No suitable activity type found.")
             return False
 
-        for record in records:
-            # Skip if record is not valid
-            if not record or not hasattr(record, 'id') or not record.id:
-                logger.warning("Skipping invalid certificate record")
-                continue
-
-            # Verify the record still exists
-            if not record.exists():
-                logger.warning("Skipping non-existent certificate record")
-                continue
-
-            # Get certificate name safely
-            certificate_name = (
-                    getattr(record, 'name', None) or
-                    getattr(record, 'display_name', None) or
-                    getattr(record, 'description', None) or
-                    f"Certificate {record.id}"
+        # Search for certifications expiring within the largest tier
+        domain = [
+            ('display_type', '=', 'certification'),
+            (end_date_field, '>', today),
+            (end_date_field, '<=', today + timedelta(days=tiers[-1])),
+            ('employee_id.parent_id.user_id', '!=', False),
+        ]
+        # Only look at what changed since the last run, or entered a tier since then
+        processing_state = self._get_processing_state()
+        run_start = fields.Datetime.now()
+        watermark = processing_state.last_processed_at
+        if watermark:
+            # Overlap with the previous run: transactions still open then committed older write_dates.
+            # Reprocessing is harmless, existing notifications and activities are skipped.
+            watermark -= timedelta(minutes=10)
+            domain = expression.AND([domain, expression.OR([
+                [('write_date', '>', watermark)],
+                [('employee_id.write_date', '>', watermark)],
+                [('employee_id.parent_id.write_date', '>', watermark)],
+                *([(end_date_field, '>', watermark.date() + timedelta(days=tier)),
+                   (end_date_field, '<=', today + timedelta(days=tier))] for tier in tiers),
+            ])])
+        certificates = self.env['hr.resume.line'].search_fetch(
+            domain, ['name', 'description', 'employee_id', end_date_field],
+        )
+        certificates.employee_id.fetch(['name', 'parent_id'])
+        certificates.employee_id.parent_id.fetch(['name', 'user_id'])
+
+        NotificationRecord = self.env['certificate.notification.record']
+        notification_records = {
+            (record.employee_id.id, record.certificate_id.id): record
+            for record in NotificationRecord.search_fetch(
+                [('certificate_id', 'in', certificates.ids)], ['employee_id', 'certificate_id', 'expiry_date'],
+                order='id desc',
             )
-            logger.info(f"Processing record: {certificate_name}")
-
-            employee = record.employee_id
-            if not employee or not hasattr(employee, 'id') or not employee.id:
-                logger.warning(f"Skipping certificate {certificate_name} - no valid employee")
-                continue
-
+        }
+        # Renewed certifications: refresh the expiry date of their existing records
+        renewed_records = {}
+        for certificate in certificates:
+            record = notification_records.get((certificate.employee_id.id, certificate.id))
+            if record and record.expiry_date != certificate[end_date_field]:
+                renewed_records.setdefault(certificate[end_date_field], NotificationRecord)
+                renewed_records[certificate[end_date_field]] |= record
+        for expiry_date, records in renewed_records.items():
+            records.expiry_date = expiry_date
+        missing = certificates.filtered(
+            lambda certificate: (certificate.employee_id.id, certificate.id) not in notification_records
+        )
+        for record in NotificationRecord.create([{
+            'employee_id': certificate.employee_id.id,
+            'certificate_id': certificate.id,
+            'expiry_date': certificate[end_date_field],
+            'certificate_name': self._get_certificate_name(certificate),  # Store as backup
+        } for certificate in missing]):
+            notification_records[record.employee_id.id, record.certificate_id.id] = record
+
+        # One notification per certification, manager, expiry date and tier: claim the keys
+        # in the log, whose unique index turns already notified ones into conflicts
+        notifications = {}
+        for certificate in certificates:
+            expiry_date = certificate[end_date_field]
+            days_until_expiry = (expiry_date - today).days
+            tier = next(tier for tier in tiers if days_until_expiry <= tier)
+            notification_record = notification_records[certificate.employee_id.id, certificate.id]
+            key = (notification_record.id, certificate.employee_id.parent_id.user_id.id, expiry_date, tier)
+            notifications[key] = certificate
+        claimed = self.env['certificate.notification.log']._claim(notifications)
+
+        res_model_id = self.env['ir.model']._get_id('certificate.notification.record')
+        activity_vals_list = []
+        for key in claimed:
+            certificate = notifications[key]
+            notification_record_id, user_id, _expiry_date, tier = key
+            employee = certificate.employee_id
             manager = employee.parent_id
-            if not manager or not hasattr(manager, 'id') or not manager.id:
-                logger.warning(f"Skipping certificate {certificate_name} - no manager for {employee.name}")
-                continue
-            if not manager.user_id:
-                logger.warning(f"Skipping certificate {certificate_name} - manager {manager.name} has no user")
-                continue
-
-            # Get the expiry date using the correct field
-            expiry_date = getattr(record, end_date_field)
-            if not expiry_date:
-                logger.warning(f"Skipping certificate {certificate_name} - no expiry date")
-                continue
-
+            certificate_name = self._get_certificate_name(certificate)
+            expiry_date = certificate[end_date_field]
             days_until_expiry = (expiry_date - today).days
             notification_summary = f"Team Member {employee.name}: {certificate_name} - expires in {days_until_expiry} days"
-
-            # Create or get notification record
-            try:
-                notification_record = self.env['certificate.notification.record'].search([
-                    ('employee_id', '=', employee.id),
-                    ('certificate_id', '=', record.id)
-                ], limit=1)
-
-                if not notification_record:
-                    notification_record = self.env['certificate.notification.record'].create({
-                        'employee_id': employee.id,
-                        'certificate_id': record.id,
-                        'expiry_date': expiry_date,
-                        'certificate_name': certificate_name,  # Store as backup
-                    })
-
-                # Ensure the notification record is valid before creating activity
-                if not notification_record or not hasattr(notification_record, 'id') or not notification_record.id:
-                    logger.error(f"Failed to create valid notification record for {certificate_name}")
-                    continue
-
-            except Exception as e:
-                logger.error(f"Error creating notification record for {certificate_name}: {e}")
-                continue
-
-            # Check for existing activity
-            existing = self.env['mail.activity'].search([
-                ('res_model_id', '=', self.env['ir.model']._get_id('certificate.notification.record')),
-                ('res_id', '=', notification_record.id),
-                ('user_id', '=', manager.user_id.id),
-                ('summary', '=', notification_summary)
-            ], limit=1)
-
-            if not existing:
-                try:
-                    activity = self.env['mail.activity'].create({
-                        'summary': notification_summary,
-                        'activity_type_id': activity_type.id,
-                        'note': f'🚨 Certification Expiry Notification\n\n'
-                                f'Employee: {employee.name}\n'
-                                f'Manager: {manager.name}\n'
-                                f'Certification: {certificate_name}\n'
-                                f'Expiry Date: {expiry_date.strftime("%B %d, %Y")}\n'
-                                f'Days Remaining: {days_until_expiry} days\n'
-                                f'Notification Sent: {today.strftime("%B %d, %Y")}\n\n'
-                                f'📋 Click this activity to automatically view all certificates for this employee.\n'
-                                f'💡 The notification will auto-redirect to the certificate list.',
-                        'res_model_id': self.env['ir.model']._get_id('certificate.notification.record'),
-                        'res_id': notification_record.id,
-                        'user_id': manager.user_id.id,
-                        'date_deadline': expiry_date
-                    })
-                    logger.info(f"Created activity for {certificate_name} - {employee.name}")
-                except Exception as e:
-                    logger.error(f"Error creating activity for {certificate_name}: {e}")
-                    continue
-
+            activity_vals_list.append({
+                'summary': notification_summary,
+                'activity_type_id': activity_type.id,
+                'note': f'🚨 Certification Expiry Notification\n\n'
+                        f'Employee: {employee.name}\n'
+                        f'Manager: {manager.name}\n'
+                        f'Certification: {certificate_name}\n'
+                        f'Expiry Date: {expiry_date.strftime("%B %d, %Y")}\n'
+                        f'Days Remaining: {days_until_expiry} days\n'
+                        f'Notification Sent: {today.strftime("%B %d, %Y")}\n\n'
+                        f'📋 Click this activity to automatically view all certificates for this employee.\n'
+                        f'💡 The notification will auto-redirect to the certificate list.',
+                'res_model_id': res_model_id,
+                'res_id': notification_record_id,
+                'user_id': user_id,
+                'date_deadline': expiry_date
+            })
+
+        self.env['mail.activity'].create(activity_vals_list)
+        processing_state.last_processed_at = run_start
+        logger.info("Certificate processing done: %s notification records and %s activities created",
+                    len(missing), len(activity_vals_list))
         return True
 
     @api.model
     def cleanup_broken_notifications(self):
-        """Utility method to clean up notification records with broken certificate references"""
+        """Utility method to clean up notification records with broken certificate references
+
+        Deleted resume lines are detached by ``hr.resume.line.unlink``: this is only
+        needed for references broken before that, e.g. by direct SQL deletions.
+        """
         logger.info("Cleaning up broken certificate notification records...")
 
         # Use SQL to find and clean broken references more efficiently
@@ -446,6 +394,21 @@ class NotificationCertificate(models.Model):
 class HrEmployee(models.Model):
     _inherit = 'hr.employee'
 
+    def write(self, vals):
+        res = super().write(vals)
+        # A new manager, or a manager's new user, must be notified of the team's certifications
+        employees = self.browse()
+        if 'parent_id' in vals:
+            employees |= self
+        if 'user_id' in vals:
+            employees |= self.child_ids
+        if employees and self.env['hr.resume.line'].sudo().search_count([
+            ('employee_id', 'in', employees.ids),
+            ('display_type', '=', 'certification'),
+        ], limit=1):
+            self.env.ref('custom_hr_module.cron_certificate_processing')._trigger()
+        return res
+
     def action_view_certificates(self):
         """Action to view certificates for this employee"""
         return {
@@ -462,4 +425,55 @@ class HrEmployee(models.Model):
                 'default_display_type': 'certification'
             },
             'target': 'current',
-        }
\ No newline at end of file
+        }
+
+
+class HrResumeLine(models.Model):
+    _inherit = 'hr.resume.line'
+
+    def _get_certificate_processing_fields(self):
+        """Fields whose change can make a certification need a notification."""
+        end_date_field = self.env['notification.certificate']._get_certificate_end_date_field()
+        return {'display_type', 'employee_id', 'name'} | ({end_date_field} if end_date_field else set())
+
+    def _trigger_certificate_processing(self):
+        if any(line.display_type == 'certification' for line in self):
+            self.env.ref('custom_hr_module.cron_certificate_processing')._trigger()
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        lines = super().create(vals_list)
+        lines._trigger_certificate_processing()
+        return lines
+
+    def write(self, vals):
+        res = super().write(vals)
+        if self._get_certificate_processing_fields() & set(vals):
+            self._trigger_certificate_processing()
+        return res
+
+    def unlink(self):
+        """Detach the notification records of the deleted lines, keeping a snapshot of them.
+
+        A single statement copies the certificate name and description into the
+        notification records and nulls their reference, whatever the number of lines.
+        """
+        if not self.ids:
+            return super().unlink()
+        NotificationRecord = self.env['certificate.notification.record']
+        NotificationRecord.flush_model(['certificate_id'])
+        self.env.cr.execute(SQL("""
+            UPDATE certificate_notification_record record
+               SET certificate_name = COALESCE(%(name)s, record.certificate_name),
+                   certificate_description = COALESCE(%(description)s, record.certificate_description),
+                   certificate_id = NULL
+              FROM hr_resume_line line
+             WHERE record.certificate_id = line.id AND line.id IN %(ids)s
+         RETURNING record.id
+        """, name=self._field_to_sql('line', 'name'), description=self._field_to_sql('line', 'description'),
+            ids=tuple(self.ids)))
+        records = NotificationRecord.browse([row[0] for row in self.env.cr.fetchall()])
+        if records:
+            records.invalidate_recordset(['certificate_id', 'certificate_name', 'certificate_description'])
+            records.modified(['certificate_id', 'certificate_name'])
+        return super().unlink()
@@ -24,12 +24,44 @@ class ResConfigSettings(models.TransientModel):
         config_parameter='employee_id_format.number_format',
         help='Format for the numeric part of employee IDs (uses employee database ID)')
 
+    employee_id_migration_chunk_size = fields.Integer(
+        string='ID Migration Chunk Size',
+        config_parameter='employee_id_format.migration_chunk_size',
+        default=1000,
+        help='Number of employees migrated per transaction when the Employee ID format changes.'
+    )
+
+    certificate_notification_tiers = fields.Char(
+        string='Certificate Notification Tiers',
+        config_parameter='custom_hr_module.certificate_notification_tiers',
+        default='60,30,7,1',
+        help='Comma-separated numbers of days before expiry at which managers are notified '
+             'of their team members\' expiring certifications, once per tier.'
+    )
+
+    def _get_employee_id_format_params(self):
+        get_param = self.env['ir.config_parameter'].sudo().get_param
+        return tuple(get_param(key) for key in (
+            'employee_id_format.default_prefix',
+            'employee_id_format.default_suffix',
+            'employee_id_format.number_format',
+        ))
+
     def set_values(self):
+        old_format = self._get_employee_id_format_params()
+        old_tiers = self.env['ir.config_parameter'].sudo().get_param('custom_hr_module.certificate_notification_tiers')
         super(ResConfigSettings, self).set_values()
         set_param = self.env['ir.config_parameter'].sudo().set_param
         set_param('employee_id_format.default_prefix', self.employee_prefix_default or 'EMP')
         set_param('employee_id_format.default_suffix', self.employee_suffix_default or '')
         set_param('employee_id_format.number_format', self.employee_number_format or '{}')
+        if self._get_employee_id_format_params() != old_format:
+            self.env.registry.clear_cache()  # drop the cached Employee ID formatter
+            self.env['hr.employee.id.migration']._schedule()
+        if self.env['ir.config_parameter'].sudo().get_param('custom_hr_module.certificate_notification_tiers') != old_tiers:
+            # New tiers apply to all certifications, not only the ones changed since the last run
+            self.env['notification.certificate']._get_processing_state().last_processed_at = False
+            self.env.ref('custom_hr_module.cron_certificate_processing')._trigger()
 
     def get_values(self):
         res = super(ResConfigSettings, self).get_values()
@@ -1,24 +1,65 @@
 import {registry} from "@web/core/registry";
-import {Component, onMounted, useRef, onWillUnmount} from "@odoo/owl";
+import {Component, onMounted, onWillStart, useRef, useState, onWillUnmount} from "@odoo/owl";
 import { useService } from "@web/core/utils/hooks";
-const Chart = window.Chart;
+import { loadBundle } from "@web/core/assets";
+
+// Employee table: rows are fetched by page and only the visible ones are rendered
+const ROW_HEIGHT = 37;
+const PAGE_SIZE = 100;
+const OVERSCAN = 10;
+
+/**
+ * Decode the columnar employee rows sent by the server (see
+ * hr.onboarding.report._encode_employee_rows) into row objects.
+ */
+function decodeEmployeeRows(columns) {
+    const rows = new Array(columns.length);
+    for (let i = 0; i < columns.length; i++) {
+        rows[i] = {
+            employee_name: columns.employee_name[i],
+            department: columns.departments[columns.department[i]],
+            job_title: columns.jobs[columns.job_title[i]],
+            start_date: columns.start_date[i],
+            end_date: columns.end_date[i],
+        };
+    }
+    return rows;
+}
 
 class HROnboardingReportAction extends Component {
     static template = "custom_hr_module.HROnboardingReportTemplate";
 
     setup() {
         this.action = useService("action");
+        this.orm = useService("orm");
         this.onboardingChartRef = useRef("onboardingChart");
         this.offboardingChartRef = useRef("offboardingChart");
+        this.employeeTableRef = useRef("employeeTable");
+        this.trendChartRef = useRef("trendChart");
+        this.trendChartInstance = null;
+
+        this.table = useState({
+            rows: {},
+            total: 0,
+            loaded: false,
+            start: 0,
+            end: 0,
+            order: 'employee_name',
+            direction: 'asc',
+        });
+        this.loadingPages = new Set();
+        // Expanded/collapsed department nodes, the whole tree comes with the report data
+        this.departmentTree = useState({collapsed: {}});
+        // Employees behind the clicked chart slice
+        this.slice = useState({eventType: null, name: null, rows: [], total: 0});
+
+        // Chart.js is only loaded with the report, from Odoo's own bundled copy
+        onWillStart(() => Promise.all([loadBundle("web.chartjs_lib"), this.loadPage(0)]));
 
         this.onboardingChartInstance = null;
         this.offboardingChartInstance = null;
 
-        onMounted(() => {
-            setTimeout(() => {
-                this.renderCharts();
-            }, 100);
-        });
+        onMounted(() => this.renderCharts());
 
         onWillUnmount(() => {
             if (this.onboardingChartInstance) {
@@ -27,6 +68,9 @@ class HROnboardingReportAction extends Component {
             if (this.offboardingChartInstance) {
                 this.offboardingChartInstance.destroy();
             }
+            if (this.trendChartInstance) {
+                this.trendChartInstance.destroy();
+            }
         });
     }
 
@@ -47,8 +91,171 @@ class HROnboardingReportAction extends Component {
         return this.props.action.context.date_to || '';
     }
 
-    get employeeData() {
-        return this.reportData.employee_data || [];
+    get trendData() {
+        return this.reportData.trend_data || null;
+    }
+
+    get comparisonData() {
+        return this.reportData.comparison_data || null;
+    }
+
+    get comparisonLines() {
+        const {departments, total} = this.comparisonData;
+        return [...departments, {...total, id: 'total', name: 'Total'}];
+    }
+
+    formatChange(change) {
+        if (change === null || change === undefined) {
+            return '-';
+        }
+        return `${change > 0 ? '+' : ''}${change}%`;
+    }
+
+    changeClass(delta) {
+        return delta > 0 ? 'text-success' : delta < 0 ? 'text-danger' : 'text-muted';
+    }
+
+    get reportJobId() {
+        return this.props.action.context.report_job_id || false;
+    }
+
+    get departmentIds() {
+        return this.props.action.context.department_ids || [];
+    }
+
+    exportUrl(fileFormat) {
+        const params = new URLSearchParams({
+            date_from: this.date_from,
+            date_to: this.date_to,
+            department_ids: this.departmentIds.join(','),
+        });
+        return `/custom_hr_module/onboarding_report/export/${fileFormat}?${params}`;
+    }
+
+    get visibleRows() {
+        const rows = [];
+        for (let index = this.table.start; index < this.table.end; index++) {
+            rows.push({index, data: this.table.rows[index]});
+        }
+        return rows;
+    }
+
+    get topPadding() {
+        return this.table.start * ROW_HEIGHT;
+    }
+
+    get bottomPadding() {
+        return Math.max(0, this.table.total - this.table.end) * ROW_HEIGHT;
+    }
+
+    async loadPage(page) {
+        if (this.loadingPages.has(page)) {
+            return;
+        }
+        this.loadingPages.add(page);
+        const {order, direction} = this.table;
+        const kwargs = {offset: page * PAGE_SIZE, limit: PAGE_SIZE, order, direction};
+        // Reports generated in the background are paged from their stored result
+        const result = this.reportJobId
+            ? await this.orm.call('hr.onboarding.report.job', 'get_employee_page', [[this.reportJobId]], kwargs)
+            : await this.orm.call(
+                'hr.onboarding.report',
+                'get_employee_page',
+                [this.date_from, this.date_to, this.departmentIds],
+                kwargs
+            );
+        if (order !== this.table.order || direction !== this.table.direction) {
+            return; // sorting changed while this page was loading
+        }
+        decodeEmployeeRows(result.columns).forEach((row, i) => {
+            this.table.rows[page * PAGE_SIZE + i] = row;
+        });
+        this.table.total = result.total;
+        this.table.loaded = true;
+        this.updateVisibleRange();
+    }
+
+    updateVisibleRange() {
+        const el = this.employeeTableRef.el;
+        const scrollTop = el ? el.scrollTop : 0;
+        const height = el ? el.clientHeight : 300;
+        this.table.start = Math.max(0, Math.floor(scrollTop / ROW_HEIGHT) - OVERSCAN);
+        this.table.end = Math.min(this.table.total, Math.ceil((scrollTop + height) / ROW_HEIGHT) + OVERSCAN);
+
+        const firstPage = Math.floor(this.table.start / PAGE_SIZE);
+        const lastPage = Math.floor(Math.max(this.table.end - 1, 0) / PAGE_SIZE);
+        for (let page = firstPage; page <= lastPage; page++) {
+            if (!(page * PAGE_SIZE in this.table.rows)) {
+                this.loadPage(page);
+            }
+        }
+    }
+
+    onTableScroll() {
+        this.updateVisibleRange();
+    }
+
+    onSort(column) {
+        if (this.table.order === column) {
+            this.table.direction = this.table.direction === 'asc' ? 'desc' : 'asc';
+        } else {
+            this.table.order = column;
+            this.table.direction = 'asc';
+        }
+        this.table.rows = {};
+        this.loadingPages.clear();
+        if (this.employeeTableRef.el) {
+            this.employeeTableRef.el.scrollTop = 0;
+        }
+        this.loadPage(0);
+    }
+
+    sortIcon(column) {
+        if (this.table.order !== column) {
+            return '';
+        }
+        return this.table.direction === 'asc' ? 'fa fa-caret-up' : 'fa fa-caret-down';
+    }
+
+    async openSlice(eventType, name) {
+        Object.assign(this.slice, {eventType, name, rows: [], total: 0});
+        await this.loadSliceRows();
+    }
+
+    async loadSliceRows() {
+        const {eventType, name} = this.slice;
+        const result = await this.orm.call(
+            'hr.onboarding.report',
+            'get_slice_employees',
+            [this.date_from, this.date_to, (this.reportData.slice_department_ids || {})[name] || [], eventType],
+            {offset: this.slice.rows.length, limit: PAGE_SIZE}
+        );
+        if (eventType !== this.slice.eventType || name !== this.slice.name) {
+            return; // another slice was clicked meanwhile
+        }
+        this.slice.rows.push(...decodeEmployeeRows(result.columns));
+        this.slice.total = result.total;
+    }
+
+    closeSlice() {
+        Object.assign(this.slice, {eventType: null, name: null, rows: [], total: 0});
+    }
+
+    get departmentTreeRows() {
+        const rows = [];
+        let collapsedDepth = null;
+        for (const node of this.reportData.department_tree || []) {
+            if (collapsedDepth !== null && node.depth > collapsedDepth) {
+                continue;
+            }
+            collapsedDepth = this.departmentTree.collapsed[node.id] ? node.depth : null;
+            rows.push(node);
+        }
+        return rows;
+    }
+
+    toggleDepartment(node) {
+        this.departmentTree.collapsed[node.id] = !this.departmentTree.collapsed[node.id];
     }
 
     get onboardingStats() {
@@ -81,6 +288,74 @@ class HROnboardingReportAction extends Component {
         } else {
             console.error("❌ Offboarding canvas not found!");
         }
+
+        if (this.trendData && this.trendChartRef.el) {
+            this.renderTrendChart(this.trendChartRef.el, this.trendData);
+        }
+    }
+
+    renderTrendChart(canvas, trendData) {
+        try {
+            if (this.trendChartInstance) {
+                this.trendChartInstance.destroy();
+            }
+            const colors = [
+                '#FF6384', '#36A2EB', '#FFCE56', '#4BC0C0',
+                '#9966FF', '#FF9F40', '#FF9F7F', '#8FBC8F'
+            ];
+            const datasets = [];
+            trendData.departments.forEach((department, i) => {
+                const color = colors[i % colors.length];
+                datasets.push({
+                    label: `${department.name} - Onboarding`,
+                    data: department.onboarding,
+                    backgroundColor: color,
+                    stack: 'onboarding',
+                });
+                datasets.push({
+                    label: `${department.name} - Offboarding`,
+                    data: department.offboarding.map((value) => -value),
+                    backgroundColor: color + '80',
+                    stack: 'offboarding',
+                });
+            });
+
+            this.trendChartInstance = new window.Chart(canvas.getContext('2d'), {
+                type: 'bar',
+                data: {
+                    labels: trendData.buckets,
+                    datasets: datasets,
+                },
+                options: {
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    scales: {
+                        x: {stacked: true},
+                        y: {stacked: true, ticks: {precision: 0}},
+                    },
+                    plugins: {
+                        title: {
+                            display: true,
+                            text: `Hires and departures per ${trendData.interval}`,
+                            font: {
+                                size: 16,
+                                weight: 'bold'
+                            },
+                        },
+                        legend: {
+                            position: 'right',
+                        },
+                        tooltip: {
+                            callbacks: {
+                                label: (context) => `${context.dataset.label}: ${Math.abs(context.parsed.y)}`,
+                            }
+                        }
+                    }
+                }
+            });
+        } catch (error) {
+            console.error("❌ Error rendering trend chart:", error);
+        }
     }
 
     renderPieChart(canvas, data, title, chartType) {
@@ -97,7 +372,7 @@ class HROnboardingReportAction extends Component {
             const total = Object.values(data).reduce((sum, val) => sum + val, 0);
 
             if (total === 0) {
-                const emptyChart = new Chart(ctx, {
+                const emptyChart = new window.Chart(ctx, {
                     type: 'doughnut',
                     data: {
                         labels: ['No Data'],
@@ -153,6 +428,11 @@ class HROnboardingReportAction extends Component {
                 options: {
                     responsive: true,
                     maintainAspectRatio: false,
+                    onClick: (event, elements) => {
+                        if (elements.length) {
+                            this.openSlice(chartType, labels[elements[0].index]);
+                        }
+                    },
                     plugins: {
                         title: {
                             display: true,
@@ -209,7 +489,7 @@ class HROnboardingReportAction extends Component {
                 }
             };
 
-            const chartInstance = new Chart(ctx, chartConfig);
+            const chartInstance = new window.Chart(ctx, chartConfig);
 
             if (chartType === 'onboarding') {
                 this.onboardingChartInstance = chartInstance;
@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+
+from . import test_employee_id_migration
+from . import test_hr_employee
+from . import test_notification_certificate
+from . import test_onboarding_report
@@ -0,0 +1,100 @@
+import time
+
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestEmployeeIdMigration(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Employee = cls.env['hr.employee'].with_context(active_test=False)
+        cls.Employee.create([
+            {'name': 'Default ID Employee'},
+            {'name': 'Prefixed ID Employee', 'employee_id_prefix': 'dev'},
+            {'name': 'Suffixed ID Employee', 'employee_id_suffix': 'tmp'},
+            {'name': 'Custom ID Employee', 'employee_id_prefix': 'hr_2', 'employee_id_suffix': 'x'},
+            {'name': 'Archived ID Employee', 'active': False},
+        ])
+        cls.env['ir.config_parameter'].sudo().set_param('employee_id_format.migration_chunk_size', 2)
+        cls.Migration = cls.env['hr.employee.id.migration']
+
+    def setUp(self):
+        super().setUp()
+        # Migrations commit after every chunk
+        self.patch(type(self.env.cr), 'commit', lambda cr: None)
+
+    def _set_format(self, prefix, suffix, number_format):
+        set_param = self.env['ir.config_parameter'].sudo().set_param
+        set_param('employee_id_format.default_prefix', prefix)
+        set_param('employee_id_format.default_suffix', suffix)
+        set_param('employee_id_format.number_format', number_format)
+        self.env.registry.clear_cache()
+
+    def _get_employee_ids(self):
+        employees = self.Employee.search([])
+        employees.invalidate_recordset(['employee_id'])
+        return {employee.id: employee.employee_id for employee in employees}
+
+    def _get_expected_employee_ids(self):
+        formatter = self.Employee._get_employee_id_formatter()
+        return {
+            employee.id: formatter.format(employee.id, employee.employee_id_prefix, employee.employee_id_suffix)
+            for employee in self.Employee.search([])
+        }
+
+    def _assert_migrated(self, migration, old_ids):
+        new_ids = self._get_employee_ids()
+        self.assertEqual(new_ids, self._get_expected_employee_ids())
+        self.assertEqual(migration.state, 'done')
+        self.assertEqual(
+            {(mapping.employee_id.id, mapping.old_code, mapping.new_code) for mapping in migration.mapping_ids},
+            {(employee_id, old_ids[employee_id], new_id)
+             for employee_id, new_id in new_ids.items() if old_ids[employee_id] != new_id},
+        )
+
+    def test_migration_matches_formatter(self):
+        for prefix, suffix, number_format in [
+            # Parts sanitised to empty: no prefix, or no suffix
+            ('EMP', '!', '{:03d}'),
+            ('staff', 'hq', '{:04d}'),
+            ('-!-', '!', '{:05d}'),
+            ('a_b', 'x-y', '{}'),
+        ]:
+            with self.subTest(prefix=prefix, suffix=suffix, number_format=number_format):
+                old_ids = self._get_employee_ids()
+                self._set_format(prefix, suffix, number_format)
+                migration = self.Migration._schedule()
+                self.assertEqual(migration.chunk_size, 2)
+                self.assertTrue(self.Migration._cron_process_migrations())
+                self._assert_migrated(migration, old_ids)
+
+    def test_migration_cancel_and_resume(self):
+        old_ids = self._get_employee_ids()
+        self._set_format('NEW', '!', '{:04d}')
+        migration = self.Migration._schedule()
+
+        # Cancelled by another transaction while the first chunk is processed
+        Employee = type(self.env['hr.employee'])
+        recompute = Employee._recompute_employee_id_codes
+
+        def recompute_and_cancel(employee, after_id=0, upto_id=None):
+            if not after_id:
+                self.env.cr.execute(
+                    "UPDATE hr_employee_id_migration SET state = 'cancelled' WHERE id = %s", [migration.id]
+                )
+            return recompute(employee, after_id, upto_id)
+
+        self.patch(Employee, '_recompute_employee_id_codes', recompute_and_cancel)
+        self.assertTrue(migration._process(time.monotonic() + 60))
+        self.assertEqual(migration.state, 'cancelled')
+        self.assertEqual(migration.processed_count, 2)
+        first_chunk = sorted(old_ids)[:2]
+        self.assertEqual(migration.last_employee_id, first_chunk[-1])
+        self.assertTrue(all(mapping.employee_id.id in first_chunk for mapping in migration.mapping_ids))
+
+        # Picked up again from its cursor, as after an interrupted run
+        migration.state = 'running'
+        self.assertTrue(self.Migration._cron_process_migrations())
+        self._assert_migrated(migration, old_ids)
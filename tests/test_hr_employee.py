@@ -0,0 +1,29 @@
+from datetime import date
+
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestHrEmployee(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.employee = cls.env['hr.employee'].create({'name': 'Departing Employee'})
+        cls.contract = cls.env['hr.contract'].create({
+            'name': 'Departing Employee Contract',
+            'employee_id': cls.employee.id,
+            'wage': 1000,
+            'date_start': date(2023, 1, 1),
+            'date_end': date(2024, 6, 30),
+        })
+        cls.employee.active = False
+
+    def test_departure_dates_follow_contract_changes(self):
+        self.assertEqual(self.employee._get_departure_dates(), {self.employee.id: date(2024, 6, 30)})
+
+        self.contract.date_end = date(2024, 9, 30)
+        self.assertEqual(self.employee._get_departure_dates(), {self.employee.id: date(2024, 9, 30)})
+
+        self.employee.departure_date = date(2024, 8, 15)
+        self.assertEqual(self.employee._get_departure_dates(), {self.employee.id: date(2024, 8, 15)})
@@ -0,0 +1,67 @@
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import TransactionCase, new_test_user, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestNotificationCertificate(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.manager_user = new_test_user(cls.env, login='certificate_manager', groups='hr.group_hr_user')
+        cls.manager = cls.env['hr.employee'].create({'name': 'Certificate Manager', 'user_id': cls.manager_user.id})
+        cls.employee = cls.env['hr.employee'].create({'name': 'Certified Employee', 'parent_id': cls.manager.id})
+        cls.env['ir.config_parameter'].sudo().set_param('custom_hr_module.certificate_notification_tiers', '60,30,7,1')
+
+    def setUp(self):
+        super().setUp()
+        ResumeLine = self.env['hr.resume.line']
+        if 'certification' not in dict(ResumeLine._fields['display_type']._description_selection(self.env)):
+            self.skipTest("Certification resume lines are not available")
+
+    def _get_activities(self):
+        return self.env['mail.activity'].search([
+            ('res_model', '=', 'certificate.notification.record'),
+            ('user_id', '=', self.manager_user.id),
+        ])
+
+    def test_renewed_certification_is_notified_again(self):
+        today = fields.Date.today()
+        certificate = self.env['hr.resume.line'].create({
+            'name': 'Forklift License',
+            'employee_id': self.employee.id,
+            'display_type': 'certification',
+            'date_start': today - timedelta(days=365),
+            'date_end': today + timedelta(days=5),
+        })
+        NotificationCertificate = self.env['notification.certificate']
+        NotificationCertificate.process_certificate()
+        self.assertEqual(len(self._get_activities()), 1)
+
+        # Same tier on the next run: no new activity
+        NotificationCertificate.process_certificate()
+        self.assertEqual(len(self._get_activities()), 1)
+
+        # Renewed with a new expiry date: the same notification record is notified again
+        certificate.date_end = today + timedelta(days=20)
+        NotificationCertificate.process_certificate()
+        self.assertEqual(len(self._get_activities()), 2)
+        record = self.env['certificate.notification.record'].search([('certificate_id', '=', certificate.id)])
+        self.assertEqual(len(record), 1)
+        self.assertEqual(record.expiry_date, today + timedelta(days=20))
+
+    def test_missing_processing_state_triggers_full_run(self):
+        today = fields.Date.today()
+        self.env['hr.resume.line'].create({
+            'name': 'First Aid',
+            'employee_id': self.employee.id,
+            'display_type': 'certification',
+            'date_start': today - timedelta(days=365),
+            'date_end': today + timedelta(days=5),
+        })
+        self.env['certificate.processing.state'].sudo().search([]).unlink()
+        self.env['notification.certificate'].process_certificate()
+        self.assertEqual(len(self._get_activities()), 1)
+        self.assertTrue(self.env['certificate.processing.state'].sudo().search([]).last_processed_at)
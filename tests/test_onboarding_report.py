@@ -0,0 +1,96 @@
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestOnboardingReport(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.department = cls.env['hr.department'].create({'name': 'Onboarding Report Test'})
+        cls.employees = cls.env['hr.employee'].create([
+            {'name': 'Trend Employee 1', 'department_id': cls.department.id},
+            {'name': 'Trend Employee 2', 'department_id': cls.department.id},
+        ])
+        cls.Report = cls.env['hr.onboarding.report']
+
+    def test_trend_data_intervals(self):
+        today = fields.Date.today()
+        date_from = today - timedelta(days=400)
+        for interval in ('week', 'month', 'quarter'):
+            with self.subTest(interval=interval):
+                trend = self.Report.get_trend_data(date_from, today, [self.department.id], interval)
+                self.assertEqual(trend['interval'], interval)
+                self.assertTrue(trend['buckets'])
+                self.assertEqual(trend['buckets'], sorted(trend['buckets']))
+                self.assertLessEqual(trend['buckets'][-1], fields.Date.to_string(today))
+                department = next(
+                    department for department in trend['departments'] if department['id'] == self.department.id
+                )
+                self.assertEqual(len(department['onboarding']), len(trend['buckets']))
+                self.assertEqual(department['onboarding'][-1], 2)
+                self.assertEqual(sum(department['onboarding']), 2)
+
+    def test_trend_data_quarter_buckets(self):
+        trend = self.Report.get_trend_data('2024-02-15', '2024-12-31', [self.department.id], 'quarter')
+        self.assertEqual(trend['buckets'], ['2024-01-01', '2024-04-01', '2024-07-01', '2024-10-01'])
+
+    def test_report_cache_invalidation(self):
+        today = fields.Date.today()
+        stats = self.Report._get_report_stats(today, today, [self.department.id])
+        self.assertEqual(stats['onboarding_stats'][self.department.name], 2)
+
+        self.env['hr.employee'].create({'name': 'Trend Employee 3', 'department_id': self.department.id})
+        stats = self.Report._get_report_stats(today, today, [self.department.id])
+        self.assertEqual(stats['onboarding_stats'][self.department.name], 3)
+
+        # Department names are part of the cached stats
+        self.department.name = 'Onboarding Report Test (renamed)'
+        stats = self.Report._get_report_stats(today, today, [self.department.id])
+        self.assertIn('Onboarding Report Test (renamed)', stats['onboarding_stats'])
+
+    def test_report_cache_ignores_unrelated_changes(self):
+        Generation = self.env['hr.onboarding.report.generation']
+        generation = Generation._get_generation([self.department.id])
+        self.employees.write({'work_email': 'trend@example.com'})
+        self.assertEqual(Generation._get_generation([self.department.id]), generation)
+        self.employees[0].job_title = 'Tester'
+        self.assertGreater(Generation._get_generation([self.department.id]), generation)
+
+    def test_fact_counts_stay_non_negative(self):
+        Fact = self.env['hr.onboarding.fact']
+        domain = [('department_id', '=', self.department.id), ('event_type', '=', 'onboarding')]
+        self.assertEqual(sum(Fact.search(domain).mapped('count')), 2)
+
+        # Drift bypassing the hooks: the facts still count employees moved out by SQL
+        self.env.cr.execute("UPDATE hr_employee SET department_id = NULL WHERE id IN %s", [tuple(self.employees.ids)])
+        self.employees.invalidate_recordset(['department_id'])
+        hire_date = fields.Date.to_date(self.employees[0].create_date)
+        Fact._add_events({(hire_date, self.department.id, self.env.company.id, 'onboarding'): -5})
+        self.assertFalse(Fact.search(domain))
+
+        Fact._rebuild()
+        self.assertFalse(Fact.search(domain))
+        self.assertGreaterEqual(
+            sum(Fact.search([('department_id', '=', False), ('date', '=', hire_date)]).mapped('count')), 2
+        )
+
+    def test_headcount(self):
+        department = self.env['hr.department'].create({'name': 'Headcount Test'})
+        company_id = self.env.company.id
+        self.env['hr.onboarding.fact']._add_events({
+            (fields.Date.to_date('2024-01-10'), department.id, company_id, 'onboarding'): 2,
+            (fields.Date.to_date('2024-03-31'), department.id, company_id, 'offboarding'): 1,
+        })
+        # Unsorted and duplicated dates; nothing happened before the first one
+        headcount = self.Report.get_headcount(['2024-03-31', '2024-01-09', '2024-01-10', '2024-03-31'], [department.id])
+        self.assertEqual(headcount['dates'], ['2024-01-09', '2024-01-10', '2024-03-31'])
+        self.assertEqual(headcount['departments'], [{
+            'id': department.id,
+            'name': 'Headcount Test',
+            # Hired on the as-of date: counted; leaving on the as-of date: not counted anymore
+            'headcount': [0, 2, 1],
+        }])